@@ -28,6 +28,7 @@
 import LCD_Config
 import RPi.GPIO as GPIO
 import time
+import threading
 import numpy as np
 
 LCD_1IN44 = 1
@@ -65,6 +66,8 @@ class LCD:
 		self.LCD_Scan_Dir = SCAN_DIR_DFT
 		self.LCD_X_Adjust = LCD_X
 		self.LCD_Y_Adjust = LCD_Y
+		self._last_pix = None  # RGB565 frame currently on the panel (None = unknown)
+		self._push_lock = threading.Lock()  # render and widget threads both push frames
 
 	"""    Hardware reset     """
 	def  LCD_Reset(self):
@@ -248,6 +251,7 @@ class LCD:
 		
 		#Hardware reset
 		self.LCD_Reset()
+		self._last_pix = None
 		
 		#Set the initialization register
 		self.LCD_InitReg()
@@ -290,11 +294,21 @@ class LCD:
 
 	def LCD_Clear(self):
 		#hello
-		_buffer = [0xff]*(self.width * self.height * 2)
-		self.LCD_SetWindows(0, 0, self.width, self.height)
-		GPIO.output(LCD_Config.LCD_DC_PIN, GPIO.HIGH)
-		for i in range(0,len(_buffer),4096):
-			LCD_Config.SPI_Write_Byte(_buffer[i:i+4096])
+		_buffer = b'\xff' * (self.width * self.height * 2)
+		with self._push_lock:
+			self.LCD_SetWindows(0, 0, self.width, self.height)
+			GPIO.output(LCD_Config.LCD_DC_PIN, GPIO.HIGH)
+			LCD_Config.SPI_Write_Buffer(_buffer)
+			self._last_pix = None
+
+	def LCD_Invalidate(self):
+		"""Forget the cached panel contents so the next LCD_ShowImage pushes a full frame.
+
+		Call this whenever something other than this object may have drawn on
+		the panel (another process, another LCD instance).
+		"""
+		with self._push_lock:
+			self._last_pix = None
 
 	def LCD_ShowImage(self,Image,Xstart,Ystart):
 		if (Image == None):
@@ -304,11 +318,26 @@ class LCD:
 			raise ValueError('Image must be same dimensions as display \
 				({0}x{1}).' .format(self.width, self.height))
 		img = np.asarray(Image)
-		pix = np.zeros((self.width,self.height,2), dtype = np.uint8)
+		pix = np.zeros((self.height,self.width,2), dtype = np.uint8)
 		pix[...,[0]] = np.add(np.bitwise_and(img[...,[0]],0xF8),np.right_shift(img[...,[1]],5))
 		pix[...,[1]] = np.add(np.bitwise_and(np.left_shift(img[...,[1]],3),0xE0),np.right_shift(img[...,[2]],3))
-		pix = pix.flatten().tolist()
-		self.LCD_SetWindows(0, 0, self.width , self.height)
-		GPIO.output(LCD_Config.LCD_DC_PIN, GPIO.HIGH)
-		for i in range(0,len(pix),4096):
-			LCD_Config.SPI_Write_Byte(pix[i:i+4096])
+
+		# Only push the bounding box of pixels that changed since the last frame;
+		# diff and push happen under one lock so _last_pix always matches the glass
+		with self._push_lock:
+			x0, y0, x1, y1 = 0, 0, self.width, self.height
+			last = self._last_pix
+			if last is not None:
+				changed = np.any(pix != last, axis=2)
+				rows = np.flatnonzero(changed.any(axis=1))
+				if rows.size == 0:
+					return
+				cols = np.flatnonzero(changed.any(axis=0))
+				y0, y1 = int(rows[0]), int(rows[-1]) + 1
+				x0, x1 = int(cols[0]), int(cols[-1]) + 1
+			self._last_pix = pix
+
+			data = pix[y0:y1, x0:x1].tobytes()
+			self.LCD_SetWindows(x0, y0, x1, y1)
+			GPIO.output(LCD_Config.LCD_DC_PIN, GPIO.HIGH)
+			LCD_Config.SPI_Write_Buffer(data)
@@ -46,6 +46,15 @@ def Driver_Delay_ms(xms):
 def SPI_Write_Byte(data):
     SPI.writebytes(data)
 
+def SPI_Write_Buffer(buf):
+    """Write a bytes-like block; spidev >= 3.3 chunks it in C without a list copy."""
+    try:
+        SPI.writebytes2(buf)
+    except AttributeError:
+        data = list(bytes(buf))
+        for i in range(0, len(data), 4096):
+            SPI.writebytes(data[i:i+4096])
+
 def GPIO_Init():
     GPIO.setmode(GPIO.BCM)
     GPIO.setwarnings(False)
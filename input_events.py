@@ -16,6 +16,9 @@ Event types:
     PRESS, RELEASE, CLICK, DOUBLE_CLICK, LONG_PRESS, REPEAT
 """
 
+import mmap
+import os
+import struct
 import time
 import threading
 from collections import deque
@@ -27,6 +30,7 @@ except Exception:
     class GPIO:  # type: ignore
         BCM = None
         PUD_UP = None
+        BOTH = None
         @staticmethod
         def setmode(mode):
             pass
@@ -37,6 +41,11 @@ except Exception:
         def input(pin):
             return 1
 
+try:
+    import pigpio  # type: ignore
+except Exception:
+    pigpio = None
+
 # Event type constants
 PRESS = "PRESS"
 RELEASE = "RELEASE"
@@ -46,11 +55,92 @@ LONG_PRESS = "LONG_PRESS"
 REPEAT = "REPEAT"
 
 # Timing configuration (seconds)
-DEBOUNCE = 0.04
+# A level change is accepted once it has been read back unchanged for this long
+DEBOUNCE = 0.03
 LONG_PRESS_TIME = 0.80
 MULTI_PRESS_WINDOW = 0.30
 REPEAT_INITIAL_DELAY = 0.50
 REPEAT_INTERVAL = 0.15
+# Upper bound on how long the poll thread sleeps while idle when edge
+# detection is armed (safety net in case an edge callback is lost)
+IDLE_WAIT = 0.25
+# How long get_button_event(timeout=None) sleeps per call when no manager is
+# running, so widget loops that wait on events don't spin
+NO_MANAGER_WAIT = 0.05
+
+# BCM283x GPIO level register 0 (pins 0-31), offset inside /dev/gpiomem
+_GPLEV0 = 0x34
+
+
+class _GpioLevelReader:
+    """Read every BCM pin level (0-31) with a single load from /dev/gpiomem.
+
+    Only valid on SoCs with the BCM283x/2711 GPIO block; callers must verify
+    the result against GPIO.input before trusting it (see `open`).
+    """
+    def __init__(self, mm: mmap.mmap):
+        self._mm = mm
+
+    @classmethod
+    def open(cls, pins) -> Optional["_GpioLevelReader"]:
+        """Map /dev/gpiomem and check it agrees with RPi.GPIO for `pins`; None if unusable."""
+        if any(p < 0 or p > 31 for p in pins):
+            return None
+        try:
+            fd = os.open('/dev/gpiomem', os.O_RDONLY | os.O_SYNC)
+        except OSError:
+            return None
+        try:
+            mm = mmap.mmap(fd, 4096, mmap.MAP_SHARED, mmap.PROT_READ)
+        except (OSError, ValueError):
+            return None
+        finally:
+            os.close(fd)
+        reader = cls(mm)
+        try:
+            levels = reader.read()
+            if any(((levels >> p) & 1) != GPIO.input(p) for p in pins):
+                mm.close()
+                return None
+        except Exception:
+            mm.close()
+            return None
+        return reader
+
+    def read(self) -> int:
+        return struct.unpack_from('<I', self._mm, _GPLEV0)[0]
+
+
+class _PigpioLevelReader:
+    """Bank read through the pigpio daemon, for when /dev/gpiomem is unusable."""
+    def __init__(self, pi):
+        self._pi = pi
+
+    @classmethod
+    def open(cls, pins) -> Optional["_PigpioLevelReader"]:
+        """Connect to pigpiod and check it agrees with RPi.GPIO for `pins`; None if unusable."""
+        if pigpio is None or any(p < 0 or p > 31 for p in pins):
+            return None
+        try:
+            pi = pigpio.pi()
+            if not pi.connected:
+                return None
+        except Exception:
+            return None
+        reader = cls(pi)
+        try:
+            levels = reader.read()
+            if any(((levels >> p) & 1) != GPIO.input(p) for p in pins):
+                pi.stop()
+                return None
+        except Exception:
+            pi.stop()
+            return None
+        return reader
+
+    def read(self) -> int:
+        return self._pi.read_bank_1()
+
 
 class ButtonEventManager:
     """Polls GPIO buttons and produces high-level events.
@@ -67,6 +157,8 @@ class ButtonEventManager:
       - CLICK/DOUBLE/TRIPLE consolidated after MULTI_PRESS_WINDOW expires while button is released.
       - LONG_PRESS emitted once when held LONG_PRESS_TIME (suppresses later CLICK aggregation).
       - REPEAT emitted periodically after REPEAT_INITIAL_DELAY while held (even after LONG_PRESS by default).
+      - While every button is released and no click window is pending, the
+        thread sleeps until a GPIO edge interrupt wakes it instead of polling.
     """
     def __init__(self, gpio_pins: Dict[str, int], stop_event: threading.Event, plugin_dispatch: Optional[Callable[[dict], None]] = None):
         self.pins = gpio_pins
@@ -76,6 +168,12 @@ class ButtonEventManager:
         self._data: Dict[str, Dict[str, Any]] = {}
         self._thread: Optional[threading.Thread] = None
         self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._wake = threading.Event()
+        self._edges_armed = False
+        # (name, pin, state) rows resolved once in start() for the poll loop
+        self._table: tuple = ()
+        self._levels: Optional[Any] = None
 
     def start(self) -> None:
         if self._thread and self._thread.is_alive():
@@ -89,25 +187,58 @@ class ButtonEventManager:
             self._data[name] = {
                 "level": lvl,
                 "last_change": now,
+                "pending": None,
+                "pending_since": 0.0,
                 "press_time": None,
                 "long_emitted": False,
                 "repeat_next": None,
                 "click_count": 0,
                 "multi_deadline": None,
             }
+        self._table = tuple((name, pin, self._data[name]) for name, pin in self.pins.items())
+        # One bank read per pass instead of a GPIO.input call per pin, when available
+        pins = list(self.pins.values())
+        self._levels = _GpioLevelReader.open(pins) or _PigpioLevelReader.open(pins)
+        self.arm_edges()
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
 
+    def arm_edges(self) -> bool:
+        """(Re)register GPIO edge callbacks that wake the poll thread.
+
+        Falls back to plain polling when edge detection is unavailable.
+        Call again after the pins were reconfigured (e.g. after a payload ran).
+        """
+        armed = True
+        for pin in self.pins.values():
+            try:
+                GPIO.remove_event_detect(pin)
+            except Exception:
+                pass
+            try:
+                GPIO.add_event_detect(pin, GPIO.BOTH, callback=self._on_edge)
+            except Exception:
+                armed = False
+        self._edges_armed = armed
+        self._wake.set()
+        return armed
+
+    def _on_edge(self, _pin) -> None:
+        self._wake.set()
+
     def get_event(self, timeout: Optional[float] = None) -> Optional[dict]:
         """Blocking (with timeout) or non-blocking retrieval of next event."""
         end = None if timeout is None else time.monotonic() + timeout
-        while True:
-            with self._lock:
-                if self.events:
-                    return self.events.popleft()
-            if timeout is not None and time.monotonic() >= end:
-                return None
-            time.sleep(0.01)
+        with self._cond:
+            while not self.events:
+                if end is None:
+                    self._cond.wait()
+                    continue
+                remaining = end - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self._cond.wait(remaining)
+            return self.events.popleft()
 
     def poll(self) -> Optional[dict]:
         """Non-blocking poll."""
@@ -116,12 +247,33 @@ class ButtonEventManager:
                 return self.events.popleft()
         return None
 
+    def is_pressed(self, button: str) -> bool:
+        """Last sampled level of `button` (no GPIO read)."""
+        data = self._data.get(button)
+        return bool(data) and data["level"] == 0
+
+    def any_pressed(self) -> bool:
+        """True if any button was held at the last sample (no GPIO read)."""
+        return any(d["level"] == 0 for d in self._data.values())
+
+    def wait_released(self, timeout: float) -> bool:
+        """Sleep until no button is held (woken by RELEASE events); False on timeout."""
+        end = time.monotonic() + timeout
+        with self._cond:
+            while self.any_pressed():
+                remaining = end - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
     def _emit(self, etype: str, button: str, **extra) -> None:
         evt = {"type": etype, "button": button, "ts": time.monotonic()}
         if extra:
             evt.update(extra)
-        with self._lock:
+        with self._cond:
             self.events.append(evt)
+            self._cond.notify_all()
         if self.plugin_dispatch:
             try:
                 self.plugin_dispatch(evt)
@@ -130,28 +282,58 @@ class ButtonEventManager:
 
     def _run(self) -> None:
         SLEEP = 0.005
+        pin_mask = 0
+        for pin in self.pins.values():
+            pin_mask |= 1 << pin
+        last_state = None
+        was_idle = False
         while not self.stop_event.is_set():
+            self._wake.clear()
             now = time.monotonic()
-            for name, pin in self.pins.items():
-                data = self._data[name]
+            idle = True
+            bulk = None
+            if self._levels is not None:
                 try:
-                    lvl = GPIO.input(pin)
+                    bulk = self._levels.read()
                 except Exception:
-                    lvl = data["level"]
-                prev = data["level"]
-                if lvl != prev:  # edge
+                    self._levels = None
+            if bulk is not None:
+                # Packed pin states: if no bit flipped and nothing was held or
+                # pending last pass, there is no per-pin work to do
+                state = bulk & pin_mask
+                if state == last_state and was_idle:
+                    self._idle_wait(SLEEP)
+                    continue
+                last_state = state
+            for name, pin, data in self._table:
+                if bulk is not None:
+                    lvl = (bulk >> pin) & 1
+                else:
+                    try:
+                        lvl = GPIO.input(pin)
+                    except Exception:
+                        lvl = data["level"]
+                if lvl != data["level"]:  # edge
+                    # Debounce: the new level must read back stable for DEBOUNCE
+                    if data["pending"] != lvl:
+                        data["pending"] = lvl
+                        data["pending_since"] = now
+                        idle = False
+                        continue
+                    if now - data["pending_since"] < DEBOUNCE:
+                        idle = False
+                        continue
+                    data["pending"] = None
                     data["level"] = lvl
                     data["last_change"] = now
                     if lvl == 0:  # pressed (active low)
-                        # debounce edge
-                        if now - prev >= 0:  # redundant guard
-                            data["press_time"] = now
-                            data["long_emitted"] = False
-                            data["click_count"] += 1
-                            if data["click_count"] == 1:
-                                data["multi_deadline"] = now + MULTI_PRESS_WINDOW
-                            self._emit(PRESS, name)
-                            data["repeat_next"] = now + REPEAT_INITIAL_DELAY
+                        data["press_time"] = now
+                        data["long_emitted"] = False
+                        data["click_count"] += 1
+                        if data["click_count"] == 1:
+                            data["multi_deadline"] = now + MULTI_PRESS_WINDOW
+                        self._emit(PRESS, name)
+                        data["repeat_next"] = now + REPEAT_INITIAL_DELAY
                     else:  # released
                         self._emit(RELEASE, name)
                         if data["long_emitted"]:
@@ -159,6 +341,8 @@ class ButtonEventManager:
                             data["click_count"] = 0
                             data["multi_deadline"] = None
                 else:
+                    # Bounced back before settling
+                    data["pending"] = None
                     if lvl == 0:  # still pressed
                         pt = data["press_time"]
                         if pt and not data["long_emitted"] and (now - pt) >= LONG_PRESS_TIME:
@@ -178,7 +362,20 @@ class ButtonEventManager:
                                 self._emit(DOUBLE_CLICK, name, count=2)
                             data["click_count"] = 0
                             data["multi_deadline"] = None
-            time.sleep(SLEEP)
+                if data["level"] == 0 or data["multi_deadline"]:
+                    idle = False
+            was_idle = idle
+            if idle:
+                self._idle_wait(SLEEP)
+            else:
+                time.sleep(SLEEP)
+
+    def _idle_wait(self, poll_sleep: float) -> None:
+        """Sleep until an edge interrupt when armed, else for one poll interval."""
+        if self._edges_armed:
+            self._wake.wait(IDLE_WAIT)
+        else:
+            time.sleep(poll_sleep)
 
 # Convenience singleton pattern (optional usage):
 _manager: Optional[ButtonEventManager] = None
@@ -191,7 +388,13 @@ def init_button_events(gpio_pins: Dict[str, int], stop_event: threading.Event, p
     return _manager
 
 def get_button_event(timeout: Optional[float] = None) -> Optional[dict]:
+    """Next button event, waiting up to `timeout` (None: block).
+
+    Without a running manager no event can arrive: the call still waits
+    (timeout, or NO_MANAGER_WAIT when blocking) and then returns None.
+    """
     if _manager is None:
+        time.sleep(NO_MANAGER_WAIT if timeout is None else timeout)
         return None
     return _manager.get_event(timeout=timeout)
 
@@ -200,6 +403,29 @@ def poll_button_event() -> Optional[dict]:
         return None
     return _manager.poll()
 
+def is_button_pressed(button: str) -> Optional[bool]:
+    """Cached pressed state of `button`; None if the manager is not running."""
+    if _manager is None:
+        return None
+    return _manager.is_pressed(button)
+
+def any_button_pressed() -> Optional[bool]:
+    """Cached 'any button held' state; None if the manager is not running."""
+    if _manager is None:
+        return None
+    return _manager.any_pressed()
+
+def wait_buttons_released(timeout: float) -> Optional[bool]:
+    """Block until every button is released or `timeout` expires; None if the manager is not running."""
+    if _manager is None:
+        return None
+    return _manager.wait_released(timeout)
+
+def rearm_button_events() -> None:
+    """Re-register edge detection after GPIO pins were set up again."""
+    if _manager is not None:
+        _manager.arm_edges()
+
 def clear_button_events() -> None:
     """Drain all pending button events from the queue."""
     while True:
@@ -12,6 +12,8 @@ Life‑cycle / callback methods (all optional):
             draw_image()                -> PIL base image (DO NOT mutate globally — copy if needed).
             draw_obj()                  -> PIL ImageDraw tied to the base image.
             status_bar                  -> StatusBar instance (set_temp_status, is_busy, etc.).
+            get_button_event(timeout)   -> Next high-level button event dict (or None).
+            request_render()            -> Force the render loop to recompose the next frame.
             widget_context              -> WidgetContext instance (interactive UI helpers).
             plugin_manager              -> PluginManager instance (advanced access; prefer helpers below).
             defaults                    -> Defaults object (paths: install_path, payload_path, payload_log, etc.).
@@ -256,7 +258,7 @@ class PluginManager:
 
     def __init__(self, verbose: bool = True, event_bus=None):
         self._loaded: List[_LoadedPlugin] = []
-        self._last_tick: float = time.time()
+        self._last_tick: float = time.monotonic()
         self._ctx: dict = {}
         self.verbose = verbose
         # Event bus (wildcard capable) can be injected
@@ -480,7 +482,7 @@ class PluginManager:
     # ------------------------------------------------------------------
     def dispatch_tick(self) -> None:
         with self._lock:
-            now = time.time()
+            now = time.monotonic()
             dt = now - self._last_tick
             self._last_tick = now
             for lp in self._loaded:
@@ -519,10 +521,17 @@ class PluginManager:
                     lp.instance.on_render_overlay(tmp, draw)
                 except Exception:
                     self._log(f"[PLUGIN] rebuild_overlay error in {lp.instance.name}")
-            self._overlay_image = tmp  # atomic swap
+            # Keep the previous object when nothing changed so consumers can
+            # detect a new overlay by identity and skip redundant redraws
+            prev = self._overlay_image
+            if prev is None or prev.size != tmp.size or prev.tobytes() != tmp.tobytes():
+                self._overlay_image = tmp  # atomic swap
 
     def get_overlay(self):
-        """Return last built overlay (do not mutate)."""
+        """Return last built overlay (do not mutate).
+
+        The same object is returned until the overlay content changes.
+        """
         return self._overlay_image
 
     def get_plugin_info(self, name: str) -> str:
@@ -28,6 +28,9 @@ def _plugins_config_path(install_path: str) -> str:
     return os.path.join(install_path, 'plugins', 'plugins_conf.json')
 
 
+_ensured_dirs: set[str] = set()
+
+
 def load_plugins_conf(install_path: str) -> Dict[str, Any]:
     """Load plugins configuration and auto-discover new plugins.
 
@@ -47,10 +50,9 @@ def load_plugins_conf(install_path: str) -> Dict[str, Any]:
         return cfg
 
     updated = False
-    for name in os.listdir(plugins_root):
-        plugin_path = os.path.join(plugins_root, name)
-        if not os.path.isdir(plugin_path):
-            continue
+    with os.scandir(plugins_root) as it:
+        entries = [(e.name, e.path) for e in it if e.is_dir()]
+    for name, plugin_path in entries:
         if name.startswith('_'):
             continue  # Skip hidden/private
         if name == 'base':
@@ -245,9 +247,12 @@ def save_plugins_conf(cfg: Dict[str, Any], install_path: str) -> None:
     """Persist plugin configuration to disk."""
     try:
         path = _plugins_config_path(install_path)
-        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if path not in _ensured_dirs:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            _ensured_dirs.add(path)
+        text = json.dumps(cfg, indent=2)
         with open(path, 'w') as f:
-            json.dump(cfg, f, indent=2)
+            f.write(text)
     except Exception as e:
         print(f"[PLUGIN] Failed saving plugins_conf: {e}")
 
@@ -280,10 +285,9 @@ def discover_plugin_manifests(install_path: str) -> dict:
     plugins_root = os.path.join(install_path, 'plugins')
     if not os.path.isdir(plugins_root):
         return manifests
-    for name in os.listdir(plugins_root):
-        pdir = os.path.join(plugins_root, name)
-        if not os.path.isdir(pdir):
-            continue
+    with os.scandir(plugins_root) as it:
+        entries = [(e.name, e.path) for e in it if e.is_dir()]
+    for name, pdir in entries:
         if name in ('base', '__pycache__') or name.startswith('_'):
             continue
         manifest_path = os.path.join(pdir, 'plugin.json')
@@ -347,7 +351,7 @@ def plugin_tick_loop(manager_ref_provider, stop_event, interval: float = 0.5) ->
             manager = manager_ref_provider() if callable(manager_ref_provider) else manager_ref_provider
             if manager is not None:
                 manager.dispatch_tick()
-                now = time.time()
+                now = time.monotonic()
                 if now - last_overlay >= OVERLAY_REFRESH:
                     last_overlay = now
                     try:
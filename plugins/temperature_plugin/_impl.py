@@ -1,7 +1,10 @@
 from __future__ import annotations
+import os
 import time
 from plugins.base import Plugin
 
+SENSOR_PATH = "/sys/class/thermal/thermal_zone0/temp"
+
 class TemperaturePlugin(Plugin):
 
     def on_load(self, ctx: dict) -> None:
@@ -20,27 +23,54 @@ class TemperaturePlugin(Plugin):
         self.critical_threshold = float(self.get_config_value('critical_threshold', 80.0))
         if self.critical_threshold < self.warn_threshold:
             self.critical_threshold = self.warn_threshold + 5.0
+        self.legacy_events = bool(self.get_config_value('legacy_threshold_events', True))
         
         self._last_poll = 0.0
         self.temperature = 0.0
+        self._temp_mC = 0
+        self._prev_raw = None
+        self._sensor_fd = None
         self.ok = self._check_sensor()
         self._warn_active = False
         self._crit_active = False
+        # Render state rebuilt only when the reading or related config changes
+        self._font = ctx.get('font', None)
+        self._temp_text_cache = ""
+        self._text_w_cache: dict[str, int] = {}
+        self._text_w = 0
+        self._color_cached = None
+        self._draw_kwargs = {}
+        self._refresh_text()
+        self._refresh_color()
+        # Resolve the emit callable once instead of guarding every call
+        self._emit = self.emit if callable(getattr(self, 'emit', None)) else (lambda *a, **k: None)
         if not self.ok:
-            self.emit('temperature.sensor.error', path='/sys/class/thermal/thermal_zone0/temp')
+            self._emit('temperature.sensor.error', path=SENSOR_PATH)
+
+    def on_unload(self) -> None:
+        self._close_sensor()
 
     def _check_sensor(self) -> bool:
         try:
-            with open("/sys/class/thermal/thermal_zone0/temp", 'r') as f:
-                f.read()
+            self._read_raw_bytes()
             return True
         except Exception as e:
             print(f"[{self.name}] Sensor not found: {e}")
             return False
 
-    def _read_temp(self) -> float:
-        with open("/sys/class/thermal/thermal_zone0/temp") as f:
-            return int(f.read()) / 1000.0
+    def _read_raw_bytes(self) -> bytes:
+        # Keep the sysfs attribute open; pread at offset 0 re-samples the sensor
+        if self._sensor_fd is None:
+            self._sensor_fd = os.open(SENSOR_PATH, os.O_RDONLY)
+        return os.pread(self._sensor_fd, 16, 0).strip()
+
+    def _close_sensor(self) -> None:
+        if self._sensor_fd is not None:
+            try:
+                os.close(self._sensor_fd)
+            except OSError:
+                pass
+            self._sensor_fd = None
 
     def on_tick(self, dt: float) -> None:
         if not self.ok or not self.get_config_value("enable_display", True):
@@ -50,15 +80,27 @@ class TemperaturePlugin(Plugin):
         if now - self._last_poll >= self.refresh_interval:
             self._last_poll = now
             try:
-                value = self._read_temp()
+                raw = self._read_raw_bytes()
+                if raw == self._prev_raw:
+                    # Same millidegree reading as last poll: nothing to update
+                    return
+                self._prev_raw = raw
+                self._temp_mC = int(raw)
+                value = self._temp_mC / 1000.0
                 self.temperature = value
-                self.emit('temperature.updated', value=value, ts=now)
+                self._refresh_text()
+                self._refresh_color()
+                self._emit('temperature.updated', value=value, ts=now)
                 # Threshold transitions
                 self._handle_thresholds(value)
             except Exception as e:
                 print(f"[{self.name}] Read error: {e}")
+                self._close_sensor()
+                self._prev_raw = None
                 self.temperature = 0.0
-                self.emit('temperature.read.failed', error=str(e), ts=now)
+                self._refresh_text()
+                self._refresh_color()
+                self._emit('temperature.read.failed', error=str(e), ts=now)
 
     def on_render_overlay(self, image, draw) -> None:
         if not self.ok or not self.get_config_value("enable_display", True):
@@ -70,13 +112,10 @@ class TemperaturePlugin(Plugin):
         except Exception:
             pass
             
-        unit = "°C" if self.get_config_value("show_unit", True) else ""
-        temp_text = f"{self.temperature:.0f}{unit}"
-        
-        font = self.ctx.get('font', None)
+        temp_text = self._temp_text_cache
         # Determine horizontal position based on alignment + offset
         w, h = image.size
-        text_w = len(temp_text) * 6  # rough monospace width heuristic
+        text_w = self._text_w
         if self.align == 'center':
             x = (w - text_w) // 2
         elif self.align == 'right':
@@ -88,7 +127,7 @@ class TemperaturePlugin(Plugin):
             x = 0
         if x + text_w > w:
             x = max(0, w - text_w)
-        draw.text((x, 0), temp_text, fill=self._current_color(), font=font)
+        draw.text((x, 0), temp_text, **self._draw_kwargs)
     
     def on_config_changed(self, key: str, old_value, new_value) -> None:
         """React to configuration changes."""
@@ -98,20 +137,26 @@ class TemperaturePlugin(Plugin):
         elif key == "show_unit":
             status = "shown" if new_value else "hidden"
             print(f"[{self.name}] Temperature unit {status}")
+            self._refresh_text()
         elif key == 'refresh_interval':
             self.refresh_interval = max(0.25, float(new_value))
             print(f"[{self.name}] Refresh interval set to {self.refresh_interval}s")
         elif key == 'warn_threshold':
             self.warn_threshold = float(new_value)
+            self._refresh_color()
             print(f"[{self.name}] Warn threshold = {self.warn_threshold}C")
         elif key == 'critical_threshold':
             self.critical_threshold = float(new_value)
             if self.critical_threshold < self.warn_threshold:
                 self.critical_threshold = self.warn_threshold + 1.0
+            self._refresh_color()
             print(f"[{self.name}] Critical threshold = {self.critical_threshold}C")
         elif key == 'colorize':
             self.colorize = bool(new_value)
+            self._refresh_color()
             print(f"[{self.name}] Colorize {'enabled' if self.colorize else 'disabled'}")
+        elif key == 'legacy_threshold_events':
+            self.legacy_events = bool(new_value)
         elif key == 'temp_align':
             self.align = str(new_value).lower()
         elif key == 'temp_offset':
@@ -177,6 +222,28 @@ class TemperaturePlugin(Plugin):
             ("Temp Offset", self._menu_set_offset, "\uf07d", "Adjust overlay horizontal offset")
         ]
 
+    def _refresh_text(self) -> None:
+        unit = "°C" if self.get_config_value("show_unit", True) else ""
+        self._temp_text_cache = f"{self.temperature:.0f}{unit}"
+        self._text_w = self._text_width(self._temp_text_cache)
+
+    def _text_width(self, text: str) -> int:
+        # Measured once per distinct string; the set of readings is small
+        w = self._text_w_cache.get(text)
+        if w is None:
+            try:
+                w = int(self._font.getlength(text)) if self._font else len(text) * 6
+            except Exception:
+                w = len(text) * 6  # rough monospace width heuristic
+            self._text_w_cache[text] = w
+        return w
+
+    def _refresh_color(self) -> None:
+        color = self._current_color()
+        if color != self._color_cached or not self._draw_kwargs:
+            self._color_cached = color
+            self._draw_kwargs = {'fill': color, 'font': self._font}
+
     def _current_color(self) -> str:
         if not self.colorize:
             return 'white'
@@ -191,37 +258,37 @@ class TemperaturePlugin(Plugin):
     # Threshold handling
     # ------------------------------------------------------------------
     def _handle_thresholds(self, value: float) -> None:
-        # Critical threshold
-        if not self._crit_active and value >= self.critical_threshold:
-            self._crit_active = True
-            try:
-                self.emit('temperature.threshold.critical', value=value, threshold=self.critical_threshold)
-            except Exception:
-                pass
-        elif self._crit_active and value < (self.critical_threshold - 2):  # hysteresis
-            self._crit_active = False
-            try:
-                self.emit('temperature.threshold.critical.cleared', value=value, threshold=self.critical_threshold)
-            except Exception:
-                pass
-        # Warning threshold (only if not already critical)
-        if not self._warn_active and value >= self.warn_threshold:
-            if value < self.critical_threshold:  # avoid double firing when jumping straight to critical
-                self._warn_active = True
-                try:
-                    self.emit('temperature.threshold.warn', value=value, threshold=self.warn_threshold)
-                except Exception:
-                    pass
-        elif self._warn_active and value < (self.warn_threshold - 2):  # hysteresis
-            self._warn_active = False
-            try:
-                self.emit('temperature.threshold.warn.cleared', value=value, threshold=self.warn_threshold)
-            except Exception:
-                pass
+        # Transitions are collected and emitted once per poll
+        changes = []
+        try:
+            # Critical threshold
+            if not self._crit_active and value >= self.critical_threshold:
+                self._crit_active = True
+                changes.append(('critical', True, self.critical_threshold))
+            elif self._crit_active and value < (self.critical_threshold - 2):  # hysteresis
+                self._crit_active = False
+                changes.append(('critical', False, self.critical_threshold))
+            # Warning threshold (only if not already critical)
+            if not self._warn_active and value >= self.warn_threshold:
+                if value < self.critical_threshold:  # avoid double firing when jumping straight to critical
+                    self._warn_active = True
+                    changes.append(('warn', True, self.warn_threshold))
+            elif self._warn_active and value < (self.warn_threshold - 2):  # hysteresis
+                self._warn_active = False
+                changes.append(('warn', False, self.warn_threshold))
+            if not changes:
+                return
+            self._emit('temperature.state_changes', value=value, changes=tuple(changes))
+            if self.legacy_events:
+                for level, active, threshold in changes:
+                    event = f'temperature.threshold.{level}' if active else f'temperature.threshold.{level}.cleared'
+                    self._emit(event, value=value, threshold=threshold)
+        except Exception as e:
+            print(f"[{self.name}] Threshold handling error: {e}")
     
     def get_info(self) -> str:
         if not self.ok:
-            return "Temperature sensor not available\nPath: /sys/class/thermal/thermal_zone0/temp\nStatus: Sensor not found"
+            return f"Temperature sensor not available\nPath: {SENSOR_PATH}\nStatus: Sensor not found"
         
         # Get current configuration
         enable_display = self.get_config_value("enable_display", True)
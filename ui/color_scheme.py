@@ -43,8 +43,24 @@ class ColorScheme:
     gamepad: str = select  # outline color
     gamepad_fill: str = selected_text  # fill color when active
 
+    # Attribute names in index order (see module docstring) and their
+    # serialized config keys; drives lookup, validation and (de)serialization.
+    _FIELDS = ("background", "border", "text", "selected_text", "select", "gamepad", "gamepad_fill")
+    _FIELD_SET = frozenset(_FIELDS)
+    _CONFIG_KEYS = (
+        ("BORDER", "border"),
+        ("BACKGROUND", "background"),
+        ("TEXT", "text"),
+        ("SELECTED_TEXT", "selected_text"),
+        ("SELECTED_TEXT_BACKGROUND", "select"),
+        ("GAMEPAD", "gamepad"),
+        ("GAMEPAD_FILL", "gamepad_fill"),
+    )
+
     def __init__(self, draw_ref: Callable[[], object] | None = None):
         self._draw_ref = draw_ref
+        # ((background, border), tile, mask) for paste_menu_frame
+        self._frame_cache = None
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -60,10 +76,14 @@ class ColorScheme:
         d = draw_override or (self._draw_ref and self._draw_ref())
         if not d:
             return
-        d.line([(127, 12), (127, 127)], fill=self.border, width=5)
-        d.line([(127, 127), (0, 127)], fill=self.border, width=5)
-        d.line([(0, 127), (0, 12)], fill=self.border, width=5)
-        d.line([(0, 12), (128, 12)], fill=self.border, width=5)
+        self._paint_border(d, self.border)
+
+    @staticmethod
+    def _paint_border(d, fill) -> None:
+        d.line([(127, 12), (127, 127)], fill=fill, width=5)
+        d.line([(127, 127), (0, 127)], fill=fill, width=5)
+        d.line([(0, 127), (0, 12)], fill=fill, width=5)
+        d.line([(0, 12), (128, 12)], fill=fill, width=5)
 
     def draw_menu_background(self, draw_override=None) -> None:
         """Fill the menu interior area using the background color."""
@@ -72,6 +92,25 @@ class ColorScheme:
             return
         d.rectangle((3, 14, 124, 124), fill=self.background)
 
+    def paste_menu_frame(self, image) -> None:
+        """Paste the menu background and border onto `image` in one step.
+
+        Pixel-identical to draw_menu_background() followed by draw_border();
+        the composed frame is rendered once per (background, border) pair.
+        """
+        key = (self.background, self.border)
+        frame = self._frame_cache
+        if frame is None or frame[0] != key:
+            from PIL import Image, ImageDraw
+            tile = Image.new("RGB", (128, 128))
+            mask = Image.new("L", (128, 128), 0)
+            for d, bg, border in ((ImageDraw.Draw(tile), self.background, self.border),
+                                  (ImageDraw.Draw(mask), 255, 255)):
+                d.rectangle((3, 14, 124, 124), fill=bg)
+                self._paint_border(d, border)
+            frame = self._frame_cache = (key, tile, mask)
+        image.paste(frame[1], (0, 0), frame[2])
+
     # ------------------------------------------------------------------
     # Color access
     # ------------------------------------------------------------------
@@ -80,34 +119,25 @@ class ColorScheme:
 
         Automatically re-renders the border if the 'border' color changes.
         """
-        if hasattr(self, key):
-            setattr(self, key, value)
-            if key == "border":
-                # Re-draw immediately for visual feedback
-                self.draw_border()
-        else:
+        if key not in self._FIELD_SET:
             raise KeyError(f"Unknown color key: {key}")
+        setattr(self, key, value)
+        if key == "border":
+            # Re-draw immediately for visual feedback
+            self.draw_border()
 
     def get_color(self, key: str) -> str:
         """Get a color by its key."""
-        if hasattr(self, key):
-            return getattr(self, key)
-        raise KeyError(f"Unknown color key: {key}")
+        if key not in self._FIELD_SET:
+            raise KeyError(f"Unknown color key: {key}")
+        return getattr(self, key)
 
     # ------------------------------------------------------------------
     # Serialization helpers
     # ------------------------------------------------------------------
     def to_dict(self) -> Dict[str, str]:
         """Return a JSON‑serializable dict of the color scheme."""
-        return {
-            "BORDER": self.border,
-            "BACKGROUND": self.background,
-            "TEXT": self.text,
-            "SELECTED_TEXT": self.selected_text,
-            "SELECTED_TEXT_BACKGROUND": self.select,
-            "GAMEPAD": self.gamepad,
-            "GAMEPAD_FILL": self.gamepad_fill,
-        }
+        return {key: getattr(self, attr) for key, attr in self._CONFIG_KEYS}
 
     def load_dict(self, data: Dict[str, str]) -> None:
         """Load colors from a dict produced by `to_dict` (tolerant)."""
@@ -115,15 +145,8 @@ class ColorScheme:
             return
         # Accept either upper or lower case keys.
         norm = {k.upper(): v for k, v in data.items()}
-        # Assign using attribute names; trigger redraw for border explicitly.
-        if "BORDER" in norm:
-            self.border = norm["BORDER"]
-        self.background = norm.get("BACKGROUND", self.background)
-        self.text = norm.get("TEXT", self.text)
-        self.selected_text = norm.get("SELECTED_TEXT", self.selected_text)
-        self.select = norm.get("SELECTED_TEXT_BACKGROUND", self.select)
-        self.gamepad = norm.get("GAMEPAD", self.gamepad)
-        self.gamepad_fill = norm.get("GAMEPAD_FILL", self.gamepad_fill)
+        for key, attr in self._CONFIG_KEYS:
+            if key in norm:
+                setattr(self, attr, norm[key])
         # Redraw border if a draw context exists
         self.draw_border()
-
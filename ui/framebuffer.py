@@ -13,6 +13,10 @@ class FrameBuffer:
     def __init__(self):
         self._lock = RLock()
         self._base: Image.Image | None = None
+        self._version = 0  # bumped on every commit so readers can detect changes
+        # Reusable working frame for begin(clone=True); _scratch_lent guards nesting
+        self._scratch: Image.Image | None = None
+        self._scratch_lent = False
 
     def init(self, base: Image.Image):
         """Initialize with the base image allocated by the main application."""
@@ -20,14 +24,26 @@ class FrameBuffer:
 
     def begin(self, clone: bool = True) -> Tuple[Image.Image, ImageDraw.ImageDraw]:
         """Acquire a working frame.
-        If clone=True, returns a copy to draw; commit will merge it.
+        If clone=True, returns a copy to draw; commit will merge it. The copy
+        lives in a reused scratch image, valid until the next begin().
         The lock remains held until commit() is called.
         """
         self._lock.acquire()
         if self._base is None:
             # Create empty fallback
             self._base = Image.new("RGB", (128, 128), "BLACK")
-        working = self._base.copy() if clone else self._base
+        if not clone:
+            working = self._base
+        elif self._scratch_lent:
+            working = self._base.copy()  # nested begin: don't hand out the scratch twice
+        else:
+            scratch = self._scratch
+            if scratch is None or scratch.size != self._base.size or scratch.mode != self._base.mode:
+                scratch = self._scratch = self._base.copy()
+            else:
+                scratch.paste(self._base)
+            self._scratch_lent = True
+            working = scratch
         return working, ImageDraw.Draw(working)
 
     def commit(self, working: Image.Image, persist: bool = True):
@@ -36,7 +52,10 @@ class FrameBuffer:
             if persist and working is not self._base and self._base is not None:
                 # Copy whole working content onto base
                 self._base.paste(working)
+            self._version += 1
         finally:
+            if working is self._scratch:
+                self._scratch_lent = False
             self._lock.release()
 
     def snapshot(self) -> Image.Image:
@@ -46,6 +65,19 @@ class FrameBuffer:
                 self._base = Image.new("RGB", (128, 128), "BLACK")
             return self._base.copy()
 
+    def snapshot_into(self, dest: Image.Image) -> Image.Image:
+        """Thread-safe copy of the base frame into a preallocated image of the same size."""
+        with self._lock:
+            if self._base is None:
+                self._base = Image.new("RGB", (128, 128), "BLACK")
+            dest.paste(self._base)
+        return dest
+
+    @property
+    def version(self) -> int:
+        """Counter incremented on every commit()."""
+        return self._version
+
     def lock(self):
         return self._lock
 
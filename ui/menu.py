@@ -10,6 +10,7 @@ from typing import List, Dict, Any, Optional, Callable, Union, Tuple
 import time
 import threading
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from .widgets import WidgetContext
 from ui.framebuffer import fb
 
@@ -255,63 +256,68 @@ class ListRenderer(MenuRenderer):
 
         render_image, render_draw = fb.begin(clone=True)
 
-        self.ctx.color.draw_menu_background(draw_override=render_draw)
-        # Ensure outer border is always redrawn (may have been overwritten by fullscreen widgets)
-        self.ctx.color.draw_border(draw_override=render_draw)
-        
+        # Background + outer border (border may have been overwritten by fullscreen widgets)
+        self.ctx.color.paste_menu_frame(render_image)
+        
+        # Pin per-frame constants to locals for the row loop
+        colors = self.ctx.color
+        fonts = self.ctx.fonts
+        text_font = fonts.get('default')
+        icon_font = fonts.get('icon')
+        start_x, start_y = self.ctx.default.start_text
+        text_gap = self.ctx.default.text_gap
+        sel_fill = colors.select
+        txt_fill = colors.text
+        sel_txt_fill = colors.selected_text
+        draw_text = render_draw.text
+        draw_rect = render_draw.rectangle
+        max_len = kwargs.get('max_label_length', 20)
+
         # Draw title if provided
         title = kwargs.get('title')
         if title:
-            render_draw.text((5, 15), title, fill=self.ctx.color.selected_text,
-                              font=self.ctx.fonts.get('default'))
+            draw_text((5, 15), title, fill=sel_txt_fill, font=text_font)
             base_y = 30
         else:
-            base_y = self.ctx.default.start_text[1]
+            base_y = start_y
 
         start_idx, end_idx = self.get_visible_range(len(items), selected_index)
         visible_items = items[start_idx:end_idx]
+        icons = [item.get_display_icon() for item in visible_items]
         
         for i, item in enumerate(visible_items):
             actual_idx = start_idx + i
             is_selected = (actual_idx == selected_index)
             
-            y_pos = base_y + self.ctx.default.text_gap * i
+            y_pos = base_y + text_gap * i
             
             # Draw selection highlight
             if is_selected:
-                render_draw.rectangle(
-                    (self.ctx.default.start_text[0] - 5, y_pos,
-                     120, y_pos + 10),
-                    fill=self.ctx.color.select
-                )
+                draw_rect((start_x - 5, y_pos, 120, y_pos + 10), fill=sel_fill)
             
             # Choose colors
-            text_color = (self.ctx.color.selected_text if is_selected 
-                         else self.ctx.color.text)
+            text_color = sel_txt_fill if is_selected else txt_fill
             
             # Draw icon if available
             x_offset = 0
-            display_icon = item.get_display_icon()
+            display_icon = icons[i]
             if display_icon:
-                icon_font = self.ctx.fonts.get('icon')
-                render_draw.text(
-                    (self.ctx.default.start_text[0] - 2, y_pos),
-                    display_icon,
-                    font=icon_font,
-                    fill=text_color
-                )
+                if icon_font is not None:
+                    _paste_glyph(render_image, (start_x - 2, y_pos), display_icon, icon_font, text_color)
+                else:
+                    draw_text((start_x - 2, y_pos), display_icon, font=icon_font, fill=text_color)
                 x_offset = 12
             
             # Draw label (with marquee for selected overlength item)
-            max_len = kwargs.get('max_label_length', 20)
-            if is_selected and len(item.label) > max_len:
+            label = item.label
+            if is_selected and len(label) > max_len:
                 # If selection changed, reset marquee state
                 if self._marquee_index != actual_idx:
                     self._marquee_index = actual_idx
                     self._marquee_offset = 0
-                    self._marquee_last_update = time.time()
-                padded = item.label + (' ' * self._marquee_padding)
-                last_start = len(item.label) - max_len
+                    self._marquee_last_update = time.monotonic()
+                padded = label + (' ' * self._marquee_padding)
+                last_start = len(label) - max_len
                 if last_start < 0:
                     last_start = 0
                 # Clamp offset to last_start; once reached, hold one cycle then reset
@@ -319,13 +325,8 @@ class ListRenderer(MenuRenderer):
                     self._marquee_offset = 0
                 display_text = padded[self._marquee_offset:self._marquee_offset + max_len]
             else:
-                display_text = item.label[:max_len]
-            render_draw.text(
-                (self.ctx.default.start_text[0] + x_offset, y_pos),
-                display_text,
-                font=self.ctx.fonts.get('default'),
-                fill=text_color
-            )
+                display_text = label[:max_len]
+            draw_text((start_x + x_offset, y_pos), display_text, font=text_font, fill=text_color)
         
         # Draw status bar
         if self.ctx.status_bar:
@@ -344,6 +345,19 @@ class GridRenderer(MenuRenderer):
         self.cols = cols
         self.rows = rows
         self.items_per_page = cols * rows
+        # (start_text, [(x, y) per cell on a page]); rebuilt if the layout origin changes
+        self._cells: Tuple[tuple, List[Tuple[int, int]]] = ((), [])
+
+    def _cell_positions(self, start_x: int, start_y: int, cell_width: int, cell_height: int) -> List[Tuple[int, int]]:
+        """Top-left corner of every cell on a page, computed once per origin."""
+        key = (start_x, start_y, cell_width, cell_height)
+        if self._cells[0] != key:
+            positions = []
+            for i in range(self.items_per_page):
+                row, col = divmod(i, self.cols)
+                positions.append((start_x + col * cell_width, start_y + row * cell_height))
+            self._cells = (key, positions)
+        return self._cells[1]
     
     def get_visible_range(self, total_items: int, selected_index: int) -> Tuple[int, int]:
         """Calculate visible page for grid layout."""
@@ -428,51 +442,51 @@ class GridRenderer(MenuRenderer):
             return
         
         render_image, render_draw = fb.begin(clone=True)
-        self.ctx.color.draw_menu_background(draw_override=render_draw)
-        self.ctx.color.draw_border(draw_override=render_draw)
+        self.ctx.color.paste_menu_frame(render_image)
         
         start_idx, end_idx = self.get_visible_range(len(items), selected_index)
         visible_items = items[start_idx:end_idx]
         
         cell_width = 128 // self.cols
         cell_height = 25
+        colors = self.ctx.color
+        text_font = self.ctx.fonts.get('default')
+        icon_font = self.ctx.fonts.get('icon')
+        start_x, start_y = self.ctx.default.start_text
+        cells = self._cell_positions(start_x, start_y, cell_width, cell_height)
+        draw_text = render_draw.text
+        
+        def draw_icon_cell(x, y, icon, label, fill):
+            if icon_font is not None:
+                _paste_glyph(render_image, (x + 2, y), icon, icon_font, fill)
+            else:
+                draw_text((x + 2, y), icon, font=icon_font, fill=fill)
+            # Draw short label below icon
+            draw_text((x, y + 13), label[:8], font=text_font, fill=fill)
+        
+        def draw_text_cell(x, y, _icon, label, fill):
+            draw_text((x, y + 8), label[:10], font=text_font, fill=fill)
         
         for i, item in enumerate(visible_items):
             actual_idx = start_idx + i
             is_selected = (actual_idx == selected_index)
             
-            # Calculate grid position
-            row = i // self.cols
-            col = i % self.cols
-            
-            x = self.ctx.default.start_text[0] + (col * cell_width)
-            y = self.ctx.default.start_text[1] + (row * cell_height)
+            x, y = cells[i]
             
             # Draw selection highlight
             if is_selected:
                 render_draw.rectangle(
                     (x - 2, y - 2, x + cell_width - 3, y + cell_height - 3),
-                    fill=self.ctx.color.select
+                    fill=colors.select
                 )
             
             # Choose colors
-            text_color = (self.ctx.color.selected_text if is_selected 
-                         else self.ctx.color.text)
+            text_color = colors.selected_text if is_selected else colors.text
             
-            # Draw icon
+            # Icon cell (icon + short label) or text-only cell
             display_icon = item.get_display_icon()
-            if display_icon:
-                icon_font = self.ctx.fonts.get('icon')
-                render_draw.text((x + 2, y), display_icon, font=icon_font, fill=text_color)
-                # Draw short label below icon
-                short_text = item.label[:8]
-                render_draw.text((x, y + 13), short_text, 
-                                  font=self.ctx.fonts.get('default'), fill=text_color)
-            else:
-                # Text only
-                short_text = item.label[:10]
-                render_draw.text((x, y + 8), short_text, 
-                                  font=self.ctx.fonts.get('default'), fill=text_color)
+            draw_cell = draw_icon_cell if display_icon else draw_text_cell
+            draw_cell(x, y, display_icon, item.label, text_color)
 
         if self.ctx.status_bar:
             self.ctx.status_bar.render(render_draw, self.ctx.fonts.get('default'))
@@ -482,6 +496,56 @@ class GridRenderer(MenuRenderer):
     # Background render loop flushes
 
 
+_CAROUSEL_ICON_FONT = ('/usr/share/fonts/truetype/fontawesome/fa-solid-900.ttf', 48)
+_CAROUSEL_TITLE_FONT = ('/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf', 12)
+_CAROUSEL_ARROW_FONT = ('/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', 18)
+
+
+@lru_cache(maxsize=None)
+def _load_font(path: str, size: int):
+    """Load a TrueType face once; None if it is unavailable (callers fall back)."""
+    try:
+        from PIL import ImageFont
+        return ImageFont.truetype(path, size)
+    except Exception:
+        return None
+
+
+# Rasterized carousel glyphs (icon -> L mask), painted with a solid-color paste
+_ICON_MASKS: Dict[str, Any] = {}
+_ICON_MASK_SIZE = (80, 64)
+
+
+def _icon_mask(icon: str, font):
+    mask = _ICON_MASKS.get(icon)
+    if mask is None:
+        from PIL import Image, ImageDraw
+        w, h = _ICON_MASK_SIZE
+        mask = Image.new("L", _ICON_MASK_SIZE, 0)
+        ImageDraw.Draw(mask).text((w // 2, h // 2), icon, font=font, fill=255, anchor="mm")
+        _ICON_MASKS[icon] = mask
+    return mask
+
+
+# Small list/grid icon glyphs keyed by (icon, font), painted like ImageDraw.text
+_GLYPH_MASKS: Dict[Tuple[str, Any], Tuple[Any, int, int]] = {}
+
+
+def _paste_glyph(image, xy, icon: str, font, fill) -> None:
+    """Draw `icon` at `xy` as ImageDraw.text would, rasterizing it once per font."""
+    cached = _GLYPH_MASKS.get((icon, font))
+    if cached is None:
+        from PIL import Image, ImageDraw
+        left, top, right, bottom = font.getbbox(icon)
+        ox, oy = min(left, 0), min(top, 0)
+        mask = Image.new("L", (max(right - ox, 1), max(bottom - oy, 1)), 0)
+        ImageDraw.Draw(mask).text((-ox, -oy), icon, font=font, fill=255)
+        cached = _GLYPH_MASKS[(icon, font)] = (mask, ox, oy)
+    mask, ox, oy = cached
+    x, y = xy[0] + ox, xy[1] + oy
+    image.paste(fill, (x, y, x + mask.width, y + mask.height), mask)
+
+
 class CarouselRenderer(MenuRenderer):
     """Single-item carousel renderer with large icons."""
     
@@ -519,8 +583,7 @@ class CarouselRenderer(MenuRenderer):
             return
         
         render_image, render_draw = fb.begin(clone=True)
-        self.ctx.color.draw_menu_background(draw_override=render_draw)
-        self.ctx.color.draw_border(draw_override=render_draw)
+        self.ctx.color.paste_menu_frame(render_image)
         
         item = items[selected_index]
         total_items = len(items)
@@ -530,28 +593,27 @@ class CarouselRenderer(MenuRenderer):
         # Draw large icon
         display_icon = item.get_display_icon()
         if display_icon:
-            try:
-                from PIL import ImageFont
-                large_font = ImageFont.truetype(
-                    '/usr/share/fonts/truetype/fontawesome/fa-solid-900.ttf', 48)
-                render_draw.text((center_x, center_y - 12), display_icon, 
-                                  font=large_font, fill=self.ctx.color.selected_text, 
-                                  anchor="mm")
-            except:
+            large_font = _load_font(*_CAROUSEL_ICON_FONT)
+            if large_font is not None:
+                # Glyph rasterized once, centered on (center_x, center_y - 12)
+                w, h = _ICON_MASK_SIZE
+                render_image.paste(self.ctx.color.selected_text,
+                                   (center_x - w // 2, center_y - 12 - h // 2,
+                                    center_x + w // 2, center_y - 12 + h // 2),
+                                   _icon_mask(display_icon, large_font))
+            else:
                 # Fallback to regular font
                 render_draw.text((center_x - 10, center_y - 12), display_icon,
                                   font=self.ctx.fonts.get('icon'),
                                   fill=self.ctx.color.selected_text)
         
         # Draw title below icon
-        try:
-            from PIL import ImageFont
-            title_font = ImageFont.truetype(
-                '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf', 12)
+        title_font = _load_font(*_CAROUSEL_TITLE_FONT)
+        if title_font is not None:
             render_draw.text((center_x, center_y + 28), item.label.strip(),
                               font=title_font, fill=self.ctx.color.selected_text,
                               anchor="mm")
-        except:
+        else:
             # Fallback
             render_draw.text((center_x - len(item.label) * 3, center_y + 28),
                               item.label.strip(), font=self.ctx.fonts.get('default'),
@@ -559,15 +621,13 @@ class CarouselRenderer(MenuRenderer):
         
         # Draw navigation arrows if multiple items
         if total_items > 1:
-            try:
-                from PIL import ImageFont
-                arrow_font = ImageFont.truetype(
-                    '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', 18)
+            arrow_font = _load_font(*_CAROUSEL_ARROW_FONT)
+            if arrow_font is not None:
                 render_draw.text((20, center_y), "◀", font=arrow_font, 
                                   fill=self.ctx.color.text, anchor="mm")
                 render_draw.text((108, center_y), "▶", font=arrow_font, 
                                   fill=self.ctx.color.text, anchor="mm")
-            except:
+            else:
                 render_draw.text((15, center_y), "<", 
                                   font=self.ctx.fonts.get('default'),
                                   fill=self.ctx.color.text)
@@ -606,6 +666,7 @@ class Menu:
         self.selected_index = 0
         self.running = False
         self.title = ""
+        self._drawn_version = None  # fb.version right after our last render
     
     def set_items(self, items: List[MenuItem]) -> None:
         """Set menu items and reset selection."""
@@ -613,6 +674,11 @@ class Menu:
         self.selected_index = 0
         self._ensure_valid_selection()
     
+    def set_selection(self, index: int) -> None:
+        """Select the item at `index`, clamped to the current items."""
+        self.selected_index = index
+        self._ensure_valid_selection()
+
     def set_title(self, title: str) -> None:
         """Set the menu's title."""
         self.title = title
@@ -692,8 +758,7 @@ class Menu:
         if not self.items:
             # Show empty state
             render_image, render_draw = fb.begin(clone=True)
-            self.ctx.color.draw_menu_background(draw_override=render_draw)
-            self.ctx.color.draw_border(draw_override=render_draw)
+            self.ctx.color.paste_menu_frame(render_image)
             render_draw.text((10, 50), "No items available", 
                               font=self.ctx.fonts.get('default'),
                               fill=self.ctx.color.text)
@@ -705,6 +770,12 @@ class Menu:
             # Background loop will handle LCD flush
         else:
             self.renderer.render(self.items, self.selected_index, **render_kwargs)
+        self._drawn_version = fb.version
+
+    def _display_signature(self) -> tuple:
+        """What the menu shows: selection, renderer and every item's label/icon."""
+        return (self.selected_index, self.renderer,
+                tuple((item.label, item.get_display_icon()) for item in self.items))
     
     def run_interactive(self, 
                        exit_keys: List[str] = None,
@@ -744,7 +815,7 @@ class Menu:
                             item = self.items[sel_idx]
                             max_len = 17  # default; could be extended to dynamic
                             if len(item.label) > max_len:
-                                now = time.time()
+                                now = time.monotonic()
                                 # Initialize if selection changed
                                 if self.renderer._marquee_index != sel_idx:
                                     self.renderer._marquee_index = sel_idx
@@ -780,9 +851,18 @@ class Menu:
 
         from input_events import clear_button_events as _clear_events
         pending_left_right_press = None  # track initial press for left/right
+        # Re-render only when what is shown changed (including relabelled
+        # items) or something else committed over our frame; an idle timeout
+        # or an ignored event (e.g. a RELEASE) must not rebuild the frame
+        drawn = None
         while self.running:
-            self.render()
-            evt = self.ctx.get_button_event(timeout=0.25)
+            state = self._display_signature()
+            if state != drawn or fb.version != self._drawn_version:
+                self.render()
+                drawn = state
+            # Sleep on the event queue (fed by GPIO edge wakeups); the timeout
+            # only bounds how long stop() from another thread takes to apply
+            evt = self.ctx.get_button_event(timeout=1.0)
             if not evt:
                 continue
             etype = evt.get('type')
@@ -791,14 +871,14 @@ class Menu:
             # Acceleration only for vertical navigation
             if etype == "LONG_PRESS" and button in ("KEY_UP_PIN", "KEY_DOWN_PIN"):
                 accelerating = True
-                last_nav_time = time.time()
+                last_nav_time = time.monotonic()
                 if button == "KEY_UP_PIN":
                     self.navigate_up()
                 elif button == "KEY_DOWN_PIN":
                     self.navigate_down()
                 continue
             if accelerating and etype == "REPEAT" and button in ("KEY_UP_PIN", "KEY_DOWN_PIN"):
-                now = time.time()
+                now = time.monotonic()
                 if now - last_nav_time >= 0.05:
                     last_nav_time = now
                     if button == "KEY_UP_PIN":
@@ -824,6 +904,7 @@ class Menu:
                     else:  # RIGHT
                         if isinstance(self.renderer, ListRenderer):
                             action = self.select_current()
+                            drawn = None  # the item may have drawn over the menu
                             if action is not None:
                                 # Flush any queued events before returning
                                 _clear_events()
@@ -849,6 +930,7 @@ class Menu:
             if button == "KEY_PRESS_PIN":
                 if etype == "RELEASE":
                     action = self.select_current()
+                    drawn = None
                     if action is not None:
                         _clear_events()
                         self.running = False
@@ -862,6 +944,7 @@ class Menu:
             # Custom handlers trigger on RELEASE
             if button in custom_handlers and etype == "RELEASE":
                 result = custom_handlers[button]()
+                drawn = None
                 if result is not None:
                     _clear_events()
                     self.running = False
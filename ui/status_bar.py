@@ -10,8 +10,23 @@ from __future__ import annotations
 
 import time
 import threading
+from functools import lru_cache
 from typing import Optional, Any
 
+from PIL import Image, ImageDraw
+
+_BAR_SIZE = (128, 13)  # rows 0..12, same area as the rectangle fallback
+_STRIP_CACHE_MAX = 16
+
+
+@lru_cache(maxsize=32)
+def _text_width(font_obj: Any, text: str) -> int:
+    """Rendered width of `text`; status strings come from a small fixed set."""
+    try:
+        return font_obj.getbbox(text)[2]
+    except AttributeError:
+        return font_obj.getsize(text)[0]
+
 class StatusBar:
     """Activity and temporary status management.
 
@@ -21,7 +36,7 @@ class StatusBar:
     - Provide a simple `render` method to draw on a Pillow `ImageDraw` object
     - Offer `is_busy` to let plugins decide whether to display extra adornments
     """
-    __slots__ = ("_activity", "_temp_msg", "_temp_expires", "_lock", "_hidden")
+    __slots__ = ("_activity", "_temp_msg", "_temp_expires", "_lock", "_hidden", "_strips")
 
     def __init__(self) -> None:
         self._activity: str = ""
@@ -29,6 +44,7 @@ class StatusBar:
         self._temp_expires: float = 0.0
         self._lock = threading.Lock()
         self._hidden = False
+        self._strips: dict = {}
 
     # ---- Activity status -------------------------------------------------
     def set_activity(self, new_value: Optional[str]) -> None:
@@ -47,14 +63,14 @@ class StatusBar:
         if not message:
             return
         ttl = max(0.5, ttl)
-        expires = time.time() + ttl
+        expires = time.monotonic() + ttl
         with self._lock:
             self._temp_msg = message
             self._temp_expires = expires
 
     # ---- Composition -----------------------------------------------------
     def get_status_msg(self) -> str:
-        now = time.time()
+        now = time.monotonic()
         with self._lock:
             if self._hidden:
                 return ""
@@ -66,28 +82,44 @@ class StatusBar:
             return self._activity
 
     # ---- Rendering -------------------------------------------------------
-    def render(self, draw_obj: Any, font_obj: Any) -> None:
+    def render(self, draw_obj: Any, font_obj: Any, frame: Any = None) -> None:
         """Render the top status bar onto the provided draw object.
 
         draw_obj: PIL.ImageDraw.Draw
         font_obj: PIL.ImageFont.FreeTypeFont (or any object with getbbox / getsize)
+        frame: optional target image; when given, a pre-rendered strip for the
+            current text is pasted instead of drawing rectangle + text.
         """
         try:
             # Always draw bar background if not hidden (get_status_msg handles hidden state)
             if self.is_hidden():
                 return
-            draw_obj.rectangle((0, 0, 128, 12), fill="#000000")
             status_txt = self.get_status_msg()  # Will be empty string if no message
+            if frame is not None:
+                frame.paste(self._strip(status_txt, font_obj), (0, 0))
+                return
+            draw_obj.rectangle((0, 0, 128, 12), fill="#000000")
             if status_txt:
-                try:
-                    status_width = font_obj.getbbox(status_txt)[2]
-                except AttributeError:
-                    status_width = font_obj.getsize(status_txt)[0]
+                status_width = _text_width(font_obj, status_txt)
                 draw_obj.text(((128 - status_width) / 2, 0), status_txt, fill="WHITE", font=font_obj)
         except Exception:
             # Silently ignore rendering issues to avoid crashing render loop
             pass
 
+    def _strip(self, text: str, font_obj: Any) -> Image.Image:
+        """Return (building once) the status band image for `text`."""
+        key = (text, id(font_obj))
+        strip = self._strips.get(key)
+        if strip is None:
+            if len(self._strips) >= _STRIP_CACHE_MAX:
+                self._strips.clear()
+            strip = Image.new("RGB", _BAR_SIZE, "#000000")
+            if text:
+                width = _text_width(font_obj, text)
+                ImageDraw.Draw(strip).text(((128 - width) / 2, 0), text, fill="WHITE", font=font_obj)
+            self._strips[key] = strip
+        return strip
+
     # ---- Introspection ---------------------------------------------------
     def is_busy(self) -> bool:
         """True if any (temp or activity) message is currently displayed."""
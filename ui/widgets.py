@@ -6,15 +6,25 @@ This module provides reusable UI components that can be used across different
 programs. All widgets are designed to be independent and require minimal dependencies.
 """
 
+import re
 import time
-import textwrap
+from array import array
+from bisect import bisect_right
 from typing import List, Any, Dict
 import os
 try:
-    from input_events import clear_button_events
+    from input_events import clear_button_events, is_button_pressed
+    from input_events import get_button_event as _default_get_button_event
 except Exception:
     def clear_button_events():
         return None
+    def is_button_pressed(button):
+        return None
+    def _default_get_button_event(timeout=None):
+        # No input backend: wait like a real event source would, so widget
+        # loops blocking on events don't spin
+        time.sleep(0.05 if timeout is None else timeout)
+        return None
 try:
     from ui.framebuffer import fb
 except Exception:
@@ -37,7 +47,7 @@ class WidgetContext:
         self.status_bar = status_bar
         self.plugin_manager = plugin_manager
         self.fb = fb
-        self.get_button_event = get_button_event_func or (lambda timeout=None: None)
+        self.get_button_event = get_button_event_func or _default_get_button_event
     
     def _create_default_settings(self):
         """Create default settings if none provided."""
@@ -47,6 +57,43 @@ class WidgetContext:
         return DefaultSettings()
 
 
+# ---------------------------------------------------------------------------
+# Pre-rendered widget chrome
+# ---------------------------------------------------------------------------
+# Dialog panels, Yes/No button rows and up/down arrows have fixed geometry;
+# each variant (colors, labels, state) is rendered once and then pasted.
+_TILE_CACHE: Dict[tuple, Any] = {}
+_TILE_CACHE_MAX = 64
+
+# Shape coordinates are immutable tuples so they double as cache keys
+_UP_TRIANGLE = ((0, 18), (10, 0), (20, 18))
+_DOWN_TRIANGLE = ((10, 18), (20, 0), (0, 0))
+
+
+def _cached_tile(key: tuple, size, paint, bg="#000000"):
+    """Return (tile, mask) for `key`, building it once via paint(draw, mask_draw).
+
+    The mask starts fully transparent; only shaped tiles need to paint it.
+    """
+    tile = _TILE_CACHE.get(key)
+    if tile is None:
+        from PIL import Image, ImageDraw
+        if len(_TILE_CACHE) >= _TILE_CACHE_MAX:
+            _TILE_CACHE.clear()
+        img = Image.new("RGB", size, bg)
+        mask = Image.new("L", size, 0)
+        paint(ImageDraw.Draw(img), ImageDraw.Draw(mask))
+        tile = _TILE_CACHE[key] = (img, mask)
+    return tile
+
+
+def _triangle_tile(points, outline, fill):
+    def paint(d, m):
+        m.polygon(points, outline=255, fill=255)
+        d.polygon(points, outline=outline, fill=fill)
+    return _cached_tile(("tri", points, outline, fill), (21, 19), paint)
+
+
 class BaseWidget:
     """Base class for all widgets."""
     
@@ -121,24 +168,27 @@ class ValuePickerWidget(BaseWidget):
         if render_color is None:
             render_color = self.ctx.color.text
             
-        # Draw up triangle
-        self.ctx.draw.polygon([(offset, 53), (10 + offset, 35), (20+offset, 53)],
-            outline=self.ctx.color.gamepad, 
-            fill=(self.ctx.color.background, self.ctx.color.gamepad_fill)[up])
-        
-        # Draw down triangle  
-        self.ctx.draw.polygon([(10+offset, 93), (20+offset, 75), (offset, 75)],
-            outline=self.ctx.color.gamepad, 
-            fill=(self.ctx.color.background, self.ctx.color.gamepad_fill)[down])
+        colors = self.ctx.color
+        image = self.ctx.image
+        # Draw up / down triangles from cached tiles (masked to the triangle shape)
+        tile, mask = _triangle_tile(_UP_TRIANGLE, colors.gamepad,
+                                    (colors.background, colors.gamepad_fill)[up])
+        image.paste(tile, (offset, 35), mask)
+        tile, mask = _triangle_tile(_DOWN_TRIANGLE, colors.gamepad,
+                                    (colors.background, colors.gamepad_fill)[down])
+        image.paste(tile, (offset, 75), mask)
 
         # Draw value display
-        self.ctx.draw.rectangle([(offset + 2, 60), (offset+30, 70)], 
+        self.ctx.draw.rectangle((offset + 2, 60, offset + 30, 70),
                                fill=self.ctx.color.background)
         self.ctx.draw.text((offset + 2, 60), str(value), fill=render_color,
                           font=self.ctx.fonts.get('default'))
     
     def _check_gpio_exit_condition(self) -> bool:
         """Check GPIO exit condition. Shared by widgets that use direct GPIO access."""
+        pressed = is_button_pressed("KEY_PRESS_PIN")
+        if pressed is not None:
+            return pressed
         try:
             import RPi.GPIO as GPIO
             return GPIO.input(gpio_config.key_press_pin) == 0
@@ -152,8 +202,15 @@ class Dialog(BaseWidget):
     
     def show(self, text: str, wait: bool = True, ok_text: str = "OK"):
         """Show a simple dialog with message and OK button."""
-        # Draw dialog background
-        self.ctx.draw.rectangle([7, 35, 120, 95], fill="#ADADAD")
+        font = self.ctx.fonts.get('default')
+        ok_fill = self.ctx.color.selected_text
+
+        # Dialog background and OK button come from a cached panel
+        def paint(d, _m):
+            d.rectangle([38, 30, 63, 45], fill="#FF0000")
+            d.text((43, 33), ok_text, fill=ok_fill, font=font)
+        panel, _ = _cached_tile(("dialog", ok_text, ok_fill, id(font)), (114, 61), paint, bg="#ADADAD")
+        self.ctx.image.paste(panel, (7, 35))
         
         # Calculate text position (center horizontally)
         try:
@@ -162,12 +219,7 @@ class Dialog(BaseWidget):
             text_width = len(text) * 6  # Fallback calculation
         
         text_x = max(10, (128 - text_width) // 2)
-        self.ctx.draw.text((text_x, 45), text, fill="#000000", font=self.ctx.fonts.get('default'))
-        
-        # Draw OK button
-        self.ctx.draw.rectangle([45, 65, 70, 80], fill="#FF0000")
-        self.ctx.draw.text((50, 68), ok_text, fill=self.ctx.color.selected_text, 
-                          font=self.ctx.fonts.get('default'))
+        self.ctx.draw.text((text_x, 45), text, fill="#000000", font=font)
         
         self.update_display()
         
@@ -175,7 +227,7 @@ class Dialog(BaseWidget):
             time.sleep(0.25)
             # Wait for a button PRESS-like event before closing (any button)
             while True:
-                evt = self.ctx.get_button_event(timeout=0.5)
+                evt = self.ctx.get_button_event(timeout=None)
                 if evt and evt.get('type') == 'PRESS':
                     break
             clear_button_events()
@@ -268,28 +320,41 @@ class YesNoDialog(BaseWidget):
         time.sleep(0.25)
         
         answer_yes = False
+        drawn = None
+        font = self.ctx.fonts.get('default')
+        sel_bg = self.ctx.color.select
+        sel_fg = self.ctx.color.selected_text
+
+        # Wide labels overflow their button as they would drawn live, so the
+        # row grows with the text (up to the screen edge) instead of clipping it
+        try:
+            label_widths = (5 + font.getlength(yes_text), 71 + font.getlength(no_text))
+        except AttributeError:
+            label_widths = (5 + len(yes_text) * 6, 71 + len(no_text) * 6)
+        row_width = min(128 - 15, max(92, *(int(w) + 1 for w in label_widths)))
+
+        def button_row(yes_selected: bool):
+            """Pre-rendered Yes/No button row (relative to (15, 65))."""
+            def paint(d, _m):
+                yes_bg, yes_fg = (sel_bg, sel_fg) if yes_selected else ("#ADADAD", "#000000")
+                no_bg, no_fg = ("#ADADAD", "#000000") if yes_selected else (sel_bg, sel_fg)
+                d.rectangle([0, 0, 30, 15], fill=yes_bg)
+                d.text((5, 3), yes_text, fill=yes_fg, font=font)
+                d.rectangle([61, 0, 91, 15], fill=no_bg)
+                d.text((71, 3), no_text, fill=no_fg, font=font)
+            key = ("yn", yes_selected, yes_text, no_text, sel_bg, sel_fg, id(font))
+            return _cached_tile(key, (row_width, 16), paint, bg="#ADADAD")[0]
         
         while True:
-            # Draw Yes button
-            yes_bg = self.ctx.color.select if answer_yes else "#ADADAD"
-            yes_fg = self.ctx.color.selected_text if answer_yes else "#000000"
-            self.ctx.draw.rectangle([15, 65, 45, 80], fill=yes_bg)
-            self.ctx.draw.text((20, 68), yes_text, fill=yes_fg, 
-                              font=self.ctx.fonts.get('default'))
-
-            # Draw No button  
-            no_bg = self.ctx.color.select if not answer_yes else "#ADADAD"
-            no_fg = self.ctx.color.selected_text if not answer_yes else "#000000"
-            self.ctx.draw.rectangle([76, 65, 106, 80], fill=no_bg)
-            self.ctx.draw.text((86, 68), no_text, fill=no_fg, 
-                              font=self.ctx.fonts.get('default'))
-            
-            self.update_display()
+            # Repaint the buttons only when the highlighted answer changed
+            if drawn is not answer_yes:
+                self.ctx.image.paste(button_row(answer_yes), (15, 65))
+                self.update_display()
+                drawn = answer_yes
 
             # Event-driven input
-            evt = self.ctx.get_button_event(timeout=0.5)
+            evt = self.ctx.get_button_event(timeout=None)
             if not evt or evt.get('type') != 'PRESS':
-                time.sleep(0.05)
                 continue
             button = evt.get('button')
             
@@ -305,69 +370,217 @@ class YesNoDialog(BaseWidget):
             time.sleep(0.1)
 
 
+_WRAP_CHUNKS = re.compile(r'\s+|\S+')
+
+
+def _wrap_line(line: str, width: int) -> List[str]:
+    """Greedy word wrap that keeps whitespace (like textwrap.wrap with
+    replace_whitespace/drop_whitespace off), without TextWrapper's overhead.
+    Words longer than `width` are split; hyphens are not break points.
+    """
+    line = line.expandtabs()
+    if len(line) <= width:
+        return [line]
+    out = []
+    cur = ''
+    for chunk in _WRAP_CHUNKS.findall(line):
+        if len(cur) + len(chunk) <= width:
+            cur += chunk
+            continue
+        if len(chunk) > width:
+            # Fill the current line, then emit full-width slices
+            space = width - len(cur)
+            cur += chunk[:space]
+            chunk = chunk[space:]
+            out.append(cur)
+            while len(chunk) > width:
+                out.append(chunk[:width])
+                chunk = chunk[width:]
+        elif cur:
+            out.append(cur)
+        cur = chunk
+    if cur:
+        out.append(cur)
+    return out
+
+
+def _wrap_lines(lines: List[str], width: int) -> List[str]:
+    """Wrap each line to `width`; blank lines are kept as empty strings."""
+    wrapped: List[str] = []
+    for line in lines:
+        if not line.strip():
+            wrapped.append('')
+        else:
+            wrapped.extend(_wrap_line(line, width))
+    return wrapped
+
+
+class TextFileRows:
+    """Wrapped display rows of a text file, read from disk on demand.
+
+    Source lines are indexed incrementally as rows are requested; only a byte
+    offset and the first row number of each indexed line stay in memory, so
+    large logs can be scrolled without reading them whole. Supports len()
+    (which indexes the rest of the file), indexing and slicing like the list
+    ScrollableTextLines builds for in-memory text. Keeps one file handle open;
+    use it as a context manager or call close().
+    """
+    def __init__(self, path: str, wrap_width: int = 22):
+        self.path = path
+        self._f = open(path, 'rb')
+        self.set_wrap_width(wrap_width)
+
+    def set_wrap_width(self, wrap_width: int) -> None:
+        """Wrap rows at `wrap_width`; the line index is rebuilt on demand."""
+        self.wrap_width = wrap_width
+        self._offsets = array('q')
+        self._first_row = array('q')
+        self._next_pos = 0  # byte offset of the first line not indexed yet
+        self._rows = 0      # rows covered by the indexed lines
+        self._eof = False
+        self._cached = (-1, None)
+
+    def close(self) -> None:
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __del__(self):
+        if getattr(self, '_f', None) is not None:
+            self.close()
+
+    def _wrap(self, raw: bytes) -> List[str]:
+        line = raw.decode('utf-8', errors='ignore').rstrip('\r\n')
+        if not line.strip():
+            return ['']
+        return _wrap_line(line, self.wrap_width)
+
+    def _index_through(self, row) -> None:
+        """Index source lines until `row` is covered (None: the whole file)."""
+        if self._eof or (row is not None and row < self._rows):
+            return
+        f = self._f
+        f.seek(self._next_pos)
+        while row is None or self._rows <= row:
+            raw = f.readline()
+            if not raw:
+                self._eof = True
+                break
+            rows = self._wrap(raw)
+            self._offsets.append(self._next_pos)
+            self._first_row.append(self._rows)
+            self._cached = (len(self._offsets) - 1, rows)
+            self._rows += len(rows)
+            self._next_pos += len(raw)
+
+    def has_row(self, row: int) -> bool:
+        """True if `row` exists, indexing only as far as needed to tell."""
+        self._index_through(row)
+        return 0 <= row < self._rows
+
+    def _row(self, row: int) -> str:
+        line_no = bisect_right(self._first_row, row) - 1
+        if self._cached[0] != line_no:
+            self._f.seek(self._offsets[line_no])
+            self._cached = (line_no, self._wrap(self._f.readline()))
+        return self._cached[1][row - self._first_row[line_no]]
+
+    def __len__(self) -> int:
+        self._index_through(None)
+        return self._rows
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop = key.start, key.stop
+            if stop is None or stop < 0 or (start is not None and start < 0):
+                total = len(self)
+            else:
+                self._index_through(stop - 1)
+                total = self._rows
+            return [self._row(row) for row in range(*key.indices(total))]
+        if key < 0:
+            key += len(self)
+        if not self.has_row(key):
+            raise IndexError(key)
+        return self._row(key)
+
+
 class ScrollableTextLines(BaseWidget):
     """Scrollable text display widget."""
     
     def show(self, lines: List[str], title: str = "", wrap_width: int = 22):
-        """Display scrollable text with automatic line wrapping."""
-        # Wrap long lines
-        wrapped_lines = []
-        for line in lines:
-            if not line.strip():
-                wrapped_lines.append('')
-            else:
-                wrapped = textwrap.wrap(line, width=wrap_width,
-                                        replace_whitespace=False, drop_whitespace=False)
-                wrapped_lines.extend(wrapped if wrapped else [''])
+        """Display scrollable text with automatic line wrapping.
 
-        if not wrapped_lines:
+        `lines` may also be a TextFileRows, which wraps at `wrap_width` and
+        reads rows from disk lazily.
+        """
+        # Wrap long lines
+        if isinstance(lines, TextFileRows):
+            if lines.wrap_width != wrap_width:
+                lines.set_wrap_width(wrap_width)
+            wrapped_lines = lines
+            has_row = lines.has_row
+        else:
+            wrapped_lines = _wrap_lines(lines, wrap_width)
+            has_row = lambda row: row < len(wrapped_lines)
+
+        if not has_row(0):
             wrapped_lines = ["No content to display"]
+            has_row = lambda row: row < 1
 
         WINDOW = 7
-        total = len(wrapped_lines)
         index = 0
         offset = 0
+        drawn = None
+        font = self.ctx.fonts.get('default')
+        text_x = self.ctx.default.start_text[0]
+        text_gap = self.ctx.default.text_gap
         while True:
             if index < offset:
                 offset = index
             elif index >= offset + WINDOW:
                 offset = index - WINDOW + 1
 
-            window = wrapped_lines[offset:offset + WINDOW]
-            self.ctx.color.draw_menu_background()
-            if title:
-                self.ctx.draw.text((5, 15), title, fill=self.ctx.color.selected_text,
-                                   font=self.ctx.fonts.get('default'))
-                start_y = 30
-            else:
-                start_y = self.ctx.default.start_text[1]
-
-            for i, line in enumerate(window):
-                is_selected = (i == (index - offset))
-                if is_selected:
-                    self.ctx.draw.rectangle((self.ctx.default.start_text[0] - 5,
-                                             start_y + self.ctx.default.text_gap * i,
-                                             120,
-                                             start_y + self.ctx.default.text_gap * i + 10),
-                                            fill=self.ctx.color.select)
-                self.ctx.draw.text((self.ctx.default.start_text[0],
-                                    start_y + self.ctx.default.text_gap * i),
-                                   line,
-                                   font=self.ctx.fonts.get('default'),
-                                   fill=self.ctx.color.selected_text if is_selected else self.ctx.color.text)
-
-            self.update_display()
-            evt = self.ctx.get_button_event(timeout=0.5)
+            # Only re-render the window when the selection or scroll position moved
+            if drawn != (offset, index):
+                drawn = (offset, index)
+                colors = self.ctx.color
+                window = wrapped_lines[offset:offset + WINDOW]
+                colors.draw_menu_background()
+                if title:
+                    self.ctx.draw.text((5, 15), title, fill=colors.selected_text, font=font)
+                    start_y = 30
+                else:
+                    start_y = self.ctx.default.start_text[1]
+
+                selected_row = index - offset
+                for i, line in enumerate(window):
+                    y = start_y + text_gap * i
+                    is_selected = (i == selected_row)
+                    if is_selected:
+                        self.ctx.draw.rectangle((text_x - 5, y, 120, y + 10), fill=colors.select)
+                    self.ctx.draw.text((text_x, y), line, font=font,
+                                       fill=colors.selected_text if is_selected else colors.text)
+
+                self.update_display()
+            evt = self.ctx.get_button_event(timeout=None)
             if not evt:
                 continue
             etype = evt.get('type')
             btn = evt.get('button')
             if etype not in ('PRESS', 'REPEAT'):
                 continue
+            # Wrap around at both ends; only wrapping upward needs the row count
             if btn == 'KEY_DOWN_PIN':
-                index = (index + 1) % total
+                index = index + 1 if has_row(index + 1) else 0
             elif btn == 'KEY_UP_PIN':
-                index = (index - 1) % total
+                index = index - 1 if index > 0 else len(wrapped_lines) - 1
             elif btn in ('KEY_LEFT_PIN', 'KEY3_PIN', 'KEY_PRESS_PIN'):
                 return
 
@@ -384,53 +597,52 @@ class ScrollableText(BaseWidget):
     """
     def show(self, text: str, title: str = "", wrap_width: int = 22):
         raw_lines = text.split('\n') if text else [""]
-        wrapped: List[str] = []
-        for line in raw_lines:
-            if not line.strip():
-                wrapped.append("")
-            else:
-                segs = textwrap.wrap(line, width=wrap_width, replace_whitespace=False, drop_whitespace=False)
-                wrapped.extend(segs if segs else [""])
+        wrapped = _wrap_lines(raw_lines, wrap_width)
         if not wrapped:
             wrapped = ["(no content)"]
 
         WINDOW = 7
         top_index = 0
         total = len(wrapped)
+        drawn = None
+        font = self.ctx.fonts.get('default')
+        text_x = self.ctx.default.start_text[0]
+        text_gap = self.ctx.default.text_gap
         while True:
             if top_index < 0:
                 top_index = 0
             if top_index > max(0, total - WINDOW):
                 top_index = max(0, total - WINDOW)
 
-            view = wrapped[top_index: top_index + WINDOW]
-            self.ctx.color.draw_menu_background()
-            if title:
-                self.ctx.draw.text((5, 15), title, fill=self.ctx.color.selected_text, font=self.ctx.fonts.get('default'))
-                start_y = 30
-            else:
-                start_y = self.ctx.default.start_text[1]
-
-            for i, line in enumerate(view):
-                self.ctx.draw.text((self.ctx.default.start_text[0], start_y + self.ctx.default.text_gap * i),
-                                   line,
-                                   font=self.ctx.fonts.get('default'),
-                                   fill=self.ctx.color.text)
+            # Only re-render when the view scrolled
+            if drawn != top_index:
+                drawn = top_index
+                colors = self.ctx.color
+                view = wrapped[top_index: top_index + WINDOW]
+                colors.draw_menu_background()
+                if title:
+                    self.ctx.draw.text((5, 15), title, fill=colors.selected_text, font=font)
+                    start_y = 30
+                else:
+                    start_y = self.ctx.default.start_text[1]
+
+                for i, line in enumerate(view):
+                    self.ctx.draw.text((text_x, start_y + text_gap * i), line, font=font, fill=colors.text)
 
-            try:
-                if total > WINDOW:
-                    bar_height = 40
-                    track_top = start_y
-                    track_bottom = start_y + self.ctx.default.text_gap * (WINDOW - 1)
-                    track_height = track_bottom - track_top + 10
-                    frac = top_index / (total - WINDOW)
-                    bar_y = int(track_top + frac * (track_height - bar_height))
-                    self.ctx.draw.rectangle((122, bar_y, 125, bar_y + bar_height), fill=self.ctx.color.select)
-            except Exception:
-                pass
+                try:
+                    if total > WINDOW:
+                        bar_height = 40
+                        track_top = start_y
+                        track_bottom = start_y + text_gap * (WINDOW - 1)
+                        track_height = track_bottom - track_top + 10
+                        frac = top_index / (total - WINDOW)
+                        bar_y = int(track_top + frac * (track_height - bar_height))
+                        self.ctx.draw.rectangle((122, bar_y, 125, bar_y + bar_height), fill=colors.select)
+                except Exception:
+                    pass
 
-            self.update_display()
-            evt = self.ctx.get_button_event(timeout=0.5)
+                self.update_display()
+            evt = self.ctx.get_button_event(timeout=None)
             if not evt:
                 continue
             etype = evt.get('type')
@@ -444,6 +656,15 @@ class ScrollableText(BaseWidget):
             elif btn in ('KEY_LEFT_PIN', 'KEY3_PIN', 'KEY_PRESS_PIN'):
                 return
 
+# Picker key map: button -> (direction, use fast step)
+_PICKER_STEPS = {
+    "KEY_UP_PIN": (1, False),
+    "KEY_DOWN_PIN": (-1, False),
+    "KEY1_PIN": (1, True),
+    "KEY3_PIN": (-1, True),
+}
+
+
 class IpValuePicker(ValuePickerWidget):
     """IP value picker widget for selecting a single IP octet (0-255)."""
     
@@ -451,6 +672,8 @@ class IpValuePicker(ValuePickerWidget):
         """Show IP value picker and return selected value."""
         value = initial_value
         up_down_offset = 75
+        sx, sy = self.ctx.default.start_text
+        value_area = (sx - 5, 1 + sy, 120, sy + self.ctx.default.text_gap * 6)
         self.ctx.color.draw_menu_background()
         time.sleep(0.25)
 
@@ -459,10 +682,7 @@ class IpValuePicker(ValuePickerWidget):
             render_down = False
 
             # Clear area for text
-            self.ctx.draw.rectangle([
-                (self.ctx.default.start_text[0]-5, 1 + self.ctx.default.start_text[1]),
-                (120, self.ctx.default.start_text[1] + self.ctx.default.text_gap * 6)
-            ], fill=self.ctx.color.background)
+            self.ctx.draw.rectangle(value_area, fill=self.ctx.color.background)
 
             # Draw arrows and current value
             self._draw_up_down(value, up_down_offset, render_up, render_down, self.ctx.color.selected_text)
@@ -471,25 +691,20 @@ class IpValuePicker(ValuePickerWidget):
 
             self.update_display()
 
-            evt = self.ctx.get_button_event(timeout=0.5)
+            evt = self.ctx.get_button_event(timeout=None)
             if not evt or evt.get('type') not in ('PRESS','REPEAT'):
                 continue
             button = evt.get('button')
-            if button == "KEY_UP_PIN":
-                value = min(255, value + 1)
-                render_up = True
-            elif button == "KEY_DOWN_PIN":
-                value = max(0, value - 1)
-                render_down = True
-            elif button == "KEY1_PIN":
-                value = min(255, value + 5)
-                render_up = True
-            elif button == "KEY3_PIN":
-                value = max(0, value - 5)
-                render_down = True
-            elif button == "KEY_PRESS_PIN":
+            if button == "KEY_PRESS_PIN":
                 clear_button_events()
                 return value
+            move = _PICKER_STEPS.get(button)
+            if move is None:
+                continue
+            direction, fast = move
+            value = max(0, min(255, value + direction * (5 if fast else 1)))
+            render_up = direction > 0
+            render_down = not render_up
 
             # Redraw with movement highlight
             self._draw_up_down(value=value, offset=up_down_offset, up=render_up, down=render_down,
@@ -510,34 +725,38 @@ class ColorPicker(ValuePickerWidget):
         render_offset = self.ctx.default.updown_pos
         final_color = initial_color
         desired_color = list(int(final_color[i:i+2], 16) for i in (1, 3, 5))
+        sx, sy = self.ctx.default.start_text
+        tg = self.ctx.default.text_gap
+        top_band = [(sx - 5, 1 + sy), (120, sy + 10)]
+        bottom_band = [(sx - 5, 3 + sy + tg * 6), (120, sy + tg * 6 + 12)]
+        drawn_state = None
 
         while True:
-            # Clear full background each frame to avoid residual menu content
-            self.ctx.color.draw_menu_background()
-            self.ctx.color.draw_border()
             render_up = False
             render_down = False
-            final_color='#%02x%02x%02x' % (desired_color[0],desired_color[1],desired_color[2])
-
-            self.ctx.draw.rectangle([(self.ctx.default.start_text[0]-5, 1+ self.ctx.default.start_text[1] + self.ctx.default.text_gap * 0),(120, self.ctx.default.start_text[1] + self.ctx.default.text_gap * 0 + 10)], fill=final_color)
-            self.ctx.draw.rectangle([(self.ctx.default.start_text[0]-5, 3+ self.ctx.default.start_text[1] + self.ctx.default.text_gap * 6),(120, self.ctx.default.start_text[1] + self.ctx.default.text_gap * 6 + 12)], fill=final_color)
-
-            self._draw_up_down(desired_color[0],render_offset[0],render_up,render_down,(self.ctx.color.text, self.ctx.color.selected_text)[i_rgb == 0])
-            self._draw_up_down(desired_color[1],render_offset[1],render_up,render_down,(self.ctx.color.text, self.ctx.color.selected_text)[i_rgb == 1])
-            self._draw_up_down(desired_color[2],render_offset[2],render_up,render_down,(self.ctx.color.text, self.ctx.color.selected_text)[i_rgb == 2])
-            
-            self.update_display()
-
-            evt = self.ctx.get_button_event(timeout=0.5)
+            # Repaint (and re-format the hex) only when the color or channel changed
+            state = (tuple(desired_color), i_rgb)
+            if state != drawn_state:
+                drawn_state = state
+                # Clear full background to avoid residual menu content
+                self.ctx.color.draw_menu_background()
+                self.ctx.color.draw_border()
+                final_color = '#%02x%02x%02x' % state[0]
+                self.ctx.draw.rectangle(top_band, fill=final_color)
+                self.ctx.draw.rectangle(bottom_band, fill=final_color)
+                text_fills = (self.ctx.color.text, self.ctx.color.selected_text)
+                for ch in range(3):
+                    self._draw_up_down(desired_color[ch], render_offset[ch], render_up, render_down, text_fills[i_rgb == ch])
+                self.update_display()
+
+            evt = self.ctx.get_button_event(timeout=None)
             if not evt or evt.get('type') not in ('PRESS','REPEAT'):
                 continue
             button = evt.get('button')
             if button == "KEY_LEFT_PIN":
                 i_rgb = i_rgb - 1
-                time.sleep(0.1)
             elif button == "KEY_RIGHT_PIN":
                 i_rgb = i_rgb + 1
-                time.sleep(0.1)
             elif button == "KEY_UP_PIN":
                 desired_color[i_rgb] = desired_color[i_rgb] + 5
                 render_up = True
@@ -605,6 +824,8 @@ class NumericPicker(ValuePickerWidget):
         value = max(min_value, min(max_value, initial_value))
 
         up_down_offset = 75  # align with IpValuePicker arrows
+        sx, sy = self.ctx.default.start_text
+        value_area = (sx - 5, 1 + sy, 120, sy + self.ctx.default.text_gap * 6)
         self.ctx.color.draw_menu_background()
         time.sleep(0.20)
 
@@ -614,10 +835,7 @@ class NumericPicker(ValuePickerWidget):
 
             # Clear value area
             try:
-                self.ctx.draw.rectangle([
-                    (self.ctx.default.start_text[0]-5, 1 + self.ctx.default.start_text[1]),
-                    (120, self.ctx.default.start_text[1] + self.ctx.default.text_gap * 6)
-                ], fill=self.ctx.color.background)
+                self.ctx.draw.rectangle(value_area, fill=self.ctx.color.background)
             except Exception:
                 pass
 
@@ -631,37 +849,24 @@ class NumericPicker(ValuePickerWidget):
 
             self.update_display()
 
-            evt = self.ctx.get_button_event(timeout=0.5)
+            evt = self.ctx.get_button_event(timeout=None)
             if not evt or evt.get('type') not in ('PRESS','REPEAT'):
                 continue
             button = evt.get('button')
-            if button == "KEY_UP_PIN":
-                new_v = value + step
-                if new_v <= max_value:
-                    value = new_v
-                render_up = True
-            elif button == "KEY_DOWN_PIN":
-                new_v = value - step
-                if new_v >= min_value:
-                    value = new_v
-                render_down = True
-            elif button == "KEY1_PIN":
-                new_v = value + fast_step
-                if new_v > max_value:
-                    new_v = max_value
-                if new_v != value:
-                    value = new_v
-                render_up = True
-            elif button == "KEY3_PIN":
-                new_v = value - fast_step
-                if new_v < min_value:
-                    new_v = min_value
-                if new_v != value:
-                    value = new_v
-                render_down = True
-            elif button == "KEY_PRESS_PIN":
+            if button == "KEY_PRESS_PIN":
                 clear_button_events()
                 return value
+            move = _PICKER_STEPS.get(button)
+            if move is None:
+                continue
+            direction, fast = move
+            if fast:
+                # Fast steps clamp to the range; single steps stop short of it
+                value = max(min_value, min(max_value, value + direction * fast_step))
+            elif min_value <= value + direction * step <= max_value:
+                value += direction * step
+            render_up = direction > 0
+            render_down = not render_up
 
             # Redraw highlight frame
             self._draw_up_down(value=value, offset=up_down_offset, up=render_up, down=render_down,
@@ -670,37 +875,72 @@ class NumericPicker(ValuePickerWidget):
             time.sleep(0.08)
 
 
+# (path, extensions) -> (directory stat stamp, reusable, explorer items). The
+# stamp (mtime, inode, size, link count) changes whenever an entry is added,
+# removed or renamed, so a revisit of an unchanged directory (e.g. the payload
+# picker) costs a single stat. Coarse timestamps (2 s on the FAT boot
+# partition or USB loot) can hide a change made in the same tick as the
+# listing, so a listing taken that close to the last change is never reused.
+_LISTING_CACHE: Dict[tuple, tuple] = {}
+_LISTING_CACHE_MAX = 32
+_MTIME_GRANULARITY = 2.0
+
+
+def _list_dir(path: str, filter_exts: tuple) -> List[str]:
+    """Explorer items for `path`: "../", sorted subdirectories, then matching files.
+
+    Returns a new list on every call; the cached listing itself is never exposed.
+    """
+    key = (path, filter_exts)
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_ino, st.st_size, st.st_nlink)
+    hit = _LISTING_CACHE.get(key)
+    if hit and hit[0] == stamp and hit[1]:
+        return list(hit[2])
+    dirs = []
+    files = []
+    # scandir hands back d_type with each entry, so no per-entry stat
+    with os.scandir(path) as it:
+        for entry in it:
+            name = entry.name
+            if entry.is_dir():
+                dirs.append(name)
+            elif entry.is_file():
+                if not filter_exts or name.endswith(filter_exts):
+                    files.append(name)
+    dirs.sort(); files.sort()
+    items = ["../"] + [d + "/" for d in dirs] + files
+    if len(_LISTING_CACHE) >= _LISTING_CACHE_MAX:
+        _LISTING_CACHE.clear()
+    reusable = time.time() - st.st_mtime_ns / 1e9 > _MTIME_GRANULARITY
+    _LISTING_CACHE[key] = (stamp, reusable, tuple(items))
+    return items
+
+
 class FileExplorer(BaseWidget):
     """Simple scrollable file/directory explorer widget."""
 
-    def show(self, start_path: str = "/", extensions: str = "") -> str:
+    def show(self, start_path: str = "/", extensions=None) -> str:
         """Run the explorer interaction.
 
         Args:
             start_path: Initial directory path.
-            extensions: Pipe-separated filter (e.g. ".txt|.log"). If empty, no filtering.
+            extensions: Tuple of suffixes (e.g. (".txt", ".log")) or a pipe-separated
+                string (".txt|.log"). If empty, no filtering.
         Returns:
             Selected file path or empty string if user exits/cancels.
         """
         current_path = os.path.abspath(start_path or "/")
-        filter_exts = [e for e in extensions.split('|') if e] if extensions else []
+        if isinstance(extensions, str):
+            extensions = tuple(e for e in extensions.split('|') if e)
+        filter_exts = tuple(extensions or ())
 
         while True:
             try:
-                dirs = []
-                files = []
                 try:
-                    for entry in os.listdir(current_path):
-                        full = os.path.join(current_path, entry)
-                        if os.path.isdir(full):
-                            dirs.append(entry)
-                        elif os.path.isfile(full):
-                            if not filter_exts or any(entry.endswith(ext) for ext in filter_exts):
-                                files.append(entry)
+                    items = _list_dir(current_path, filter_exts)
                 except Exception:
                     return ""
-                dirs.sort(); files.sort()
-                items = ["../"] + [d + "/" for d in dirs] + files
 
                 # Reuse menu-based selector so navigation behavior is consistent
                 from ui.menu import Menu, MenuItem, ListRenderer
@@ -728,13 +968,11 @@ class FileExplorer(BaseWidget):
 class ImageBrowser(BaseWidget):
     """Interactive image browser widget using explorer for navigation."""
 
-    def show(self, start_path: str = "/root/", extensions: str = ".gif|.png|.bmp|.jpg|.jpeg") -> None:
+    def show(self, start_path: str = "/root/", extensions=(".gif", ".png", ".bmp", ".jpg", ".jpeg")) -> None:
         from ui.framebuffer import fb
         from gpio_config import gpio_config as _gpio_cfg
         import time, os
         from PIL import Image
-        EDGE_BUTTONS = globals().get('EDGE_BUTTONS', set())
-        _button_prev = globals().get('_button_prev', {})
         LCD = self.ctx.lcd
         path = start_path
         while True:
@@ -756,7 +994,7 @@ class ImageBrowser(BaseWidget):
                     self.blit_full(canvas, with_status=False)
                 # Wait for any button press before returning
                 while True:
-                    evt = self.ctx.get_button_event(timeout=0.5)
+                    evt = self.ctx.get_button_event(timeout=None)
                     if evt and evt.get('type') == 'PRESS':
                         break
                 if status_was_visible and getattr(self.ctx, 'status_bar', None):
@@ -812,13 +1050,13 @@ def dialog_wait_close(context: WidgetContext, handle):
     except Exception:
         pass
 
-def explorer(context: WidgetContext, path: str = "/", extensions: str = "") -> str:
+def explorer(context: WidgetContext, path: str = "/", extensions=None) -> str:
     """Show a file explorer and return the selected file path or empty string.
 
     """
     return FileExplorer(context).show(path, extensions)
 
-def browse_images(context: WidgetContext, start_path: str = "/root/", extensions: str = ".gif|.png|.bmp|.jpg|.jpeg") -> None:
+def browse_images(context: WidgetContext, start_path: str = "/root/", extensions=(".gif", ".png", ".bmp", ".jpg", ".jpeg")) -> None:
     """Convenience wrapper that creates an ImageBrowser and displays images."""
     ImageBrowser(context).show(start_path=start_path, extensions=extensions)
 